@@ -0,0 +1,69 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from irsdb.filing.models import Filing
+from irsdb.filing.xml_store import COMPRESSIONS, compress_xml, get_xml_path
+
+BATCH_SIZE = 10000
+
+
+class Command(BaseCommand):
+    help = """
+    Compress a year's xml files in the working directory. Each file is
+    replaced by a compressed copy next to it; the loader and
+    set_schema_version read either kind.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--year", dest="year", type=int, required=True)
+        parser.add_argument(
+            "--format",
+            dest="format",
+            choices=COMPRESSIONS.keys(),
+            default="gzip",
+            help="zstd needs the zstandard package",
+        )
+        parser.add_argument(
+            "--level", dest="level", type=int, default=None, help="Compression level"
+        )
+        parser.add_argument(
+            "--threads",
+            dest="threads",
+            type=int,
+            default=4,
+            help="Number of files to compress at once",
+        )
+
+    def compress(self, path):
+        """Returns the bytes saved, or None if there was no plain file"""
+        if not os.path.exists(path):
+            return None
+        size = os.path.getsize(path)
+        compressed_path = compress_xml(path, self.format, self.level)
+        return size - os.path.getsize(compressed_path)
+
+    def handle(self, *args, **options):
+        self.format = options["format"]
+        self.level = options["level"]
+
+        object_ids = list(
+            Filing.objects.filter(submission_year=options["year"]).values_list(
+                "object_id", flat=True
+            )
+        )
+        paths = [get_xml_path(object_id) for object_id in object_ids]
+        print("Compressing up to %s files with %s" % (len(paths), self.format))
+
+        compressed = 0
+        saved = 0
+        with ThreadPoolExecutor(max_workers=options["threads"]) as executor:
+            for i in range(0, len(paths), BATCH_SIZE):
+                for result in executor.map(self.compress, paths[i : i + BATCH_SIZE]):
+                    if result is not None:
+                        compressed += 1
+                        saved += result
+                print("Checked %s files" % min(i + BATCH_SIZE, len(paths)))
+
+        print("Compressed %s files, saving %.1f MB" % (compressed, saved / 1048576.0))
@@ -5,7 +5,7 @@ from django.core.management.base import BaseCommand
 from irsx.file_utils import get_index_file_URL, stream_download
 from irsx.settings import INDEX_DIRECTORY
 
-from irsdb.filing.models import Filing
+from irsdb.filing.models import INDEX_FIELDS, STUB, Filing
 
 BATCH_SIZE = 10000
 
@@ -16,11 +16,41 @@ class Command(BaseCommand):
     they don't exist. Lines are added in bulk at the end.
     """
 
+    def get_known_ids(self, year):
+        """
+        All the object_ids already entered for a year, in one query. A
+        filing entered under another year is caught by the unique object_id
+        when it's inserted instead.
+        """
+        print("Reading object_ids already entered for %s" % year)
+        return set(
+            Filing.objects.filter(submission_year=year)
+            .values_list("object_id", flat=True)
+            .iterator(chunk_size=BATCH_SIZE)
+        )
+
+    def get_stub_ids(self):
+        """The object_ids of stubs left by find_new_filings --enter"""
+        return set(Filing.objects.filter(STUB).values_list("object_id", flat=True))
+
     def add_arguments(self, parser):
         # Positional arguments
         parser.add_argument("year", nargs="+", type=str)
+        parser.add_argument(
+            "--update",
+            action="store_true",
+            help="Also overwrite entered filings with the values in the index file",
+        )
 
     def handle(self, *args, **options):
+        update_fields = None
+        if options["update"]:
+            update_fields = INDEX_FIELDS
+            stub_ids = set()
+        else:
+            # stubs are entered, but still get their index values written
+            stub_ids = self.get_stub_ids()
+
         for year in options["year"]:
             local_file_path = os.path.join(INDEX_DIRECTORY, "index_%s.csv" % year)
 
@@ -32,6 +62,9 @@ class Command(BaseCommand):
             fh = open(local_file_path, "r", encoding="utf-8-sig")
             reader = csv.DictReader(fh)
             rows_to_enter = []
+            stubs_to_fill = []
+            # object_ids already entered, by submission year
+            known_ids = {}
 
             count = 0
             for line in reader:
@@ -93,9 +126,15 @@ class Command(BaseCommand):
                         )
                     raise
 
-                try:
-                    Filing.objects.get(object_id=object_id)
-                except Filing.DoesNotExist:
+                sub_year = int(sub_year)
+                if sub_year not in known_ids:
+                    if update_fields:
+                        # every line gets written, just skip repeats in the file
+                        known_ids[sub_year] = set()
+                    else:
+                        known_ids[sub_year] = self.get_known_ids(sub_year) - stub_ids
+
+                if object_id not in known_ids[sub_year]:
                     new_sub = Filing(
                         return_id=return_id,
                         submission_year=sub_year,
@@ -109,14 +148,29 @@ class Command(BaseCommand):
                         object_id=object_id,
                     )
 
-                    rows_to_enter.append(new_sub)
+                    if object_id in stub_ids:
+                        stubs_to_fill.append(new_sub)
+                    else:
+                        rows_to_enter.append(new_sub)
+                    # catch lines repeated within the index file too
+                    known_ids[sub_year].add(object_id)
                     count += 1
 
-                if count % BATCH_SIZE == 0 and count > 0:
+                if len(rows_to_enter) + len(stubs_to_fill) >= BATCH_SIZE:
                     print("Committing %s total entered=%s" % (BATCH_SIZE, count))
-                    Filing.objects.bulk_create(rows_to_enter)
+                    Filing.objects.bulk_upsert(
+                        rows_to_enter, update_fields=update_fields
+                    )
+                    Filing.objects.bulk_upsert(
+                        stubs_to_fill, update_fields=INDEX_FIELDS
+                    )
                     print("commit complete")
                     rows_to_enter = []
+                    stubs_to_fill = []
 
-            Filing.objects.bulk_create(rows_to_enter)
-            print("Added %s new entries." % count)
+            Filing.objects.bulk_upsert(rows_to_enter, update_fields=update_fields)
+            Filing.objects.bulk_upsert(stubs_to_fill, update_fields=INDEX_FIELDS)
+            if update_fields:
+                print("Entered or updated %s entries." % count)
+            else:
+                print("Added %s new entries." % count)
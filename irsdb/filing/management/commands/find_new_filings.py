@@ -1,25 +1,81 @@
 import csv
 import os
-from os.path import isfile, join
+import re
 
 from django.core.management.base import BaseCommand
 from irsx.settings import WORKING_DIRECTORY
 
 from irsdb.filing.models import Filing
+from irsdb.filing.xml_store import COMPRESSIONS, read_archive_index
+
+BATCH_SIZE = 10000
+
+# a filing's file name, compressed or not, ends with one of these
+FILE_ENDINGS = ["_public.xml"] + [
+    "_public.xml" + suffix for suffix in COMPRESSIONS.values()
+]
+OBJECT_ID_RE = re.compile(r"^\d{18}$")
+ARCHIVE_INDEX_RE = re.compile(r"^filings_\d+\.idx$")
+
+
+def get_object_id(filename):
+    """The object_id a filing's file is named for, or None if it isn't one"""
+    for ending in FILE_ENDINGS:
+        if filename.endswith(ending):
+            object_id = filename[: -len(ending)]
+            if OBJECT_ID_RE.match(object_id):
+                return object_id
+    return None
+
+
+def get_stored_ids(directory):
+    """The object_ids of the filings in directory, loose or in an archive"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            if ARCHIVE_INDEX_RE.match(entry.name):
+                yield from read_archive_index(entry.path)
+                continue
+            object_id = get_object_id(entry.name)
+            if object_id is not None:
+                yield object_id
 
 
 class Command(BaseCommand):
     help = """
-    Read the yearly csv file line by line and add new lines if
-    they don't exist. Lines are added in bulk at the end.
+    Find the filings in the working directory, as xml files or in the
+    yearly archives, that aren't in the filing table, and write their
+    object_ids to results.csv. With --enter, add a stub filing for each of
+    them too; enter_yearly_submissions fills stubs in from the index file.
     """
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--enter",
+            action="store_true",
+            help="Add a filing, with just an object_id, for each file found",
+        )
+
     def get_writer(self, headers):
         outfilehandle = open("results.csv", "w")
         dw = csv.DictWriter(outfilehandle, headers, extrasaction="ignore")
         dw.writeheader()
         return dw
 
+    def get_known_ids(self):
+        """Every object_id already entered, in one query"""
+        return set(
+            Filing.objects.values_list("object_id", flat=True).iterator(
+                chunk_size=BATCH_SIZE
+            )
+        )
+
+    def get_stub(self, object_id):
+        # object_ids start with the year the IRS processed the filing,
+        # which is the year of the index file it'll turn up in
+        return Filing(object_id=object_id, submission_year=int(object_id[:4]))
+
     def handle(self, *args, **options):
         print("reviewing findings in %s dir" % WORKING_DIRECTORY)
         headers = [
@@ -27,25 +83,32 @@ class Command(BaseCommand):
         ]
         writer = self.get_writer(headers)
 
-        onlyfiles = [
-            f
-            for f in os.listdir(WORKING_DIRECTORY)
-            if isfile(join(WORKING_DIRECTORY, f))
-        ]
+        known_ids = self.get_known_ids()
+        print("%s filings already entered" % len(known_ids))
+
+        num_files = 0
         num_found = 0
-        found_files = {}
+        stubs = []
+        for object_id in get_stored_ids(WORKING_DIRECTORY):
+            num_files += 1
+            if object_id in known_ids:
+                continue
 
-        for file in onlyfiles:
+            # don't count the same filing twice if it's also compressed or packed
+            known_ids.add(object_id)
+            writer.writerow({"object_id": object_id})
+            num_found += 1
 
-            return_id = file.replace("_public.xml", "")
+            if options["enter"]:
+                stubs.append(self.get_stub(object_id))
+                if len(stubs) >= BATCH_SIZE:
+                    Filing.objects.bulk_upsert(stubs)
+                    stubs = []
 
-            try:
-                Filing.objects.get(object_id=return_id)
-            except Filing.DoesNotExist:
-                writer.writerow({"object_id": return_id})
-            except Filing.MultipleObjectsReturned:
-                print("Multiple objects returned for %s " % return_id)
+        if stubs:
+            Filing.objects.bulk_upsert(stubs)
 
-                num_found += 1
-        print(found_files)
+        print("Checked %s stored filings" % num_files)
         print("Found a total of %s filings not entered" % num_found)
+        if options["enter"]:
+            print("Entered %s stub filings" % num_found)
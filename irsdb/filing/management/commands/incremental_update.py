@@ -0,0 +1,111 @@
+import os
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+from irsx.file_utils import get_index_file_URL, stream_download
+from irsx.settings import INDEX_DIRECTORY
+
+from irsdb.filing.models import UNPARSED, Filing, IndexUpdate
+from irsdb.schemas.model_writers import WRITERS
+
+
+class Command(BaseCommand):
+    help = """
+    Bring a year up to date: download its latest index file, enter the
+    filings that are new since the last update and load just those.
+    Filings that are already loaded are left alone.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("year", nargs=1, type=int)
+        parser.add_argument(
+            "--no-download",
+            dest="no_download",
+            action="store_true",
+            help="Use the index file already on disk",
+        )
+        parser.add_argument(
+            "--workers",
+            dest="workers",
+            type=int,
+            default=1,
+            help="Number of loader processes to run",
+        )
+        parser.add_argument(
+            "--writer",
+            dest="writer",
+            choices=WRITERS.keys(),
+            default=None,
+            help="How rows are written. Defaults to copy on postgres",
+        )
+        parser.add_argument(
+            "--atomic",
+            action="store_true",
+            help="Write each batch and its filing status in one transaction",
+        )
+
+    def download_index(self, year, local_file_path):
+        # download next to the old one, so a failure leaves it in place
+        partial_path = local_file_path + ".part"
+        stream_download(get_index_file_URL(year), partial_path, verbose=True)
+        os.replace(partial_path, local_file_path)
+
+    def count_rows(self, local_file_path):
+        with open(local_file_path, "r", encoding="utf-8-sig") as fh:
+            # don't count the header
+            return sum(1 for line in fh) - 1
+
+    def handle(self, *args, **options):
+        year = options["year"][0]
+        local_file_path = os.path.join(INDEX_DIRECTORY, "index_%s.csv" % year)
+
+        last_update = (
+            IndexUpdate.objects.filter(submission_year=year).order_by("-id").first()
+        )
+        if last_update:
+            print(
+                "Last update on %s: %s index rows, up to object_id %s"
+                % (
+                    last_update.checked,
+                    last_update.index_rows,
+                    last_update.last_object_id,
+                )
+            )
+
+        if not options["no_download"]:
+            self.download_index(year, local_file_path)
+        index_rows = self.count_rows(local_file_path)
+        if last_update:
+            print(
+                "Index has %s rows, %s more than last time"
+                % (index_rows, index_rows - last_update.index_rows)
+            )
+
+        filings = Filing.objects.filter(submission_year=year)
+        before = filings.count()
+        # only enters the object_ids that aren't in the filing table yet
+        call_command("enter_yearly_submissions", str(year))
+        new_filings = filings.count() - before
+        print("%s new filings" % new_filings)
+
+        # --new-only leaves loaded filings and ones that failed alone
+        if filings.filter(UNPARSED).exists():
+            call_command(
+                "load_filings",
+                str(year),
+                new_only=True,
+                workers=options["workers"],
+                writer=options["writer"],
+                atomic=options["atomic"],
+            )
+        else:
+            print("Nothing to load")
+
+        last_object_id = filings.aggregate(last=Max("object_id"))["last"] or ""
+        IndexUpdate.objects.create(
+            submission_year=year,
+            index_rows=index_rows,
+            new_filings=new_filings,
+            last_object_id=last_object_id,
+        )
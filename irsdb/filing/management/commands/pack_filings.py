@@ -0,0 +1,77 @@
+import os
+
+from django.core.management.base import BaseCommand
+
+from irsdb.filing.models import Filing
+from irsdb.filing.xml_store import COMPRESSIONS, ArchiveWriter, find_xml, open_xml
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = """
+    Pack a year's xml files into one archive in the working directory,
+    filings_<year>.pack, indexed by object_id in filings_<year>.idx.
+    Filings already in the archive are skipped, so this can be run again
+    as more files are downloaded. The loader and sniff_versions read
+    filings out of the archive before looking for loose files.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--year", dest="year", type=int, required=True)
+        parser.add_argument(
+            "--format",
+            dest="format",
+            choices=COMPRESSIONS.keys(),
+            default=None,
+            help="Compress each filing in the archive. zstd needs zstandard",
+        )
+        parser.add_argument(
+            "--level", dest="level", type=int, default=None, help="Compression level"
+        )
+        parser.add_argument(
+            "--remove",
+            action="store_true",
+            help="Remove the loose files once they're packed",
+        )
+
+    def handle(self, *args, **options):
+        year = options["year"]
+        writer = ArchiveWriter(year, options["format"], options["level"])
+        print("Packing %s into %s" % (year, writer.path))
+
+        object_ids = Filing.objects.filter(submission_year=year).values_list(
+            "object_id", flat=True
+        )
+        packed = 0
+        missing = 0
+        # loose files packed since the last commit
+        to_remove = []
+        for object_id in object_ids.iterator(chunk_size=BATCH_SIZE):
+            if object_id in writer:
+                continue
+            path = find_xml(object_id)
+            if path is None:
+                missing += 1
+                continue
+
+            with open_xml(path) as infile:
+                writer.add(object_id, infile.read())
+            to_remove.append(path)
+            packed += 1
+
+            if packed % BATCH_SIZE == 0:
+                writer.commit()
+                if options["remove"]:
+                    for path in to_remove:
+                        os.remove(path)
+                to_remove = []
+                print("Packed %s filings" % packed)
+
+        writer.close()
+        if options["remove"]:
+            for path in to_remove:
+                os.remove(path)
+
+        print("Packed %s filings, %s files not found" % (packed, missing))
+        print("Archive holds %s filings" % len(writer.index))
@@ -0,0 +1,71 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
+from django.core.management.base import BaseCommand
+
+from irsdb.filing.models import Filing, read_schema_version
+
+BATCH_SIZE = 10000
+
+
+def sniff(object_id, year):
+    """Returns (object_id, schema_version), with None for a missing file"""
+    try:
+        return object_id, read_schema_version(object_id, year)
+    except FileNotFoundError:
+        return object_id, None
+
+
+class Command(BaseCommand):
+    help = """
+    Set schema_version for a year's filings from the top of each xml file,
+    without parsing them. Files are read by a pool of threads and the
+    versions are saved in one statement. Missing files are skipped.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument("--year", dest="year", type=int, required=True)
+        parser.add_argument(
+            "--threads",
+            dest="threads",
+            type=int,
+            default=16,
+            help="Number of files to read at once",
+        )
+        parser.add_argument(
+            "--all",
+            dest="all",
+            action="store_true",
+            help="Check filings that already have a schema version too",
+        )
+
+    def handle(self, *args, **options):
+        year = options["year"]
+        filings = Filing.objects.filter(submission_year=year)
+        if not options["all"]:
+            filings = filings.filter(schema_version__isnull=True)
+
+        object_ids = list(filings.values_list("object_id", flat=True))
+        print("Reading %s files" % len(object_ids))
+
+        versions = {}
+        not_found = 0
+        with ThreadPoolExecutor(max_workers=options["threads"]) as executor:
+            # hand the pool a batch at a time, so it isn't queueing a whole year
+            for i in range(0, len(object_ids), BATCH_SIZE):
+                batch = object_ids[i : i + BATCH_SIZE]
+                for object_id, schema_version in executor.map(
+                    sniff, batch, repeat(year)
+                ):
+                    if schema_version:
+                        versions[object_id] = schema_version
+                    else:
+                        not_found += 1
+                print("Read %s files" % (i + len(batch)))
+
+        print(
+            "Found versions for %s filings, %s not found" % (len(versions), not_found)
+        )
+        if versions:
+            updated = Filing.objects.set_schema_versions(versions)
+            print("Updated schema_version on %s filings" % updated)
@@ -1,12 +1,165 @@
-import os
 import re
 
-from django.db import models
-from irsx import settings as irsx_settings
+from django.conf import settings
+from django.db import connections, models, transaction
 
-XML_DIR = irsx_settings.WORKING_DIRECTORY
+from irsdb.filing.xml_store import find_xml, get_xml_path, open_filing
+
+# Where to download filings that aren't in the working directory
+XML_BASE_URL = getattr(
+    settings, "XML_BASE_URL", "https://s3.amazonaws.com/irs-form-990/"
+)
 
 VERSION_RE = re.compile(r'returnVersion="(20\d\dv\d\.\d)"')
+# The version is on the second line, well inside this many bytes
+VERSION_HEADER_SIZE = 1024
+
+# Filings that still need to be loaded. The claim query repeats this
+# condition so postgres can use the partial index built on it.
+UNPARSED = models.Q(parse_complete__isnull=True) | models.Q(parse_complete=False)
+# Filings find_new_filings --enter added with just an object_id, waiting
+# for enter_yearly_submissions to fill them in from the index file. Their
+# submission_year is a guess, so they aren't loaded until then; the claim
+# query repeats this condition.
+STUB = models.Q(return_id="", ein="")
+
+CLAIM_QUERY = """
+update filing_filing set parse_started=True, parse_worker=%s
+where id in (
+    select id from filing_filing
+    where submission_year=%s
+    and (parse_complete is null or not parse_complete)
+    and parse_started is not True
+    and not (return_id = '' and ein = '')
+    {ein_filter}
+    order by id
+    limit %s
+    for update skip locked
+)
+returning *
+"""
+
+# The fields that come from the index file, everything but object_id
+INDEX_FIELDS = [
+    "submission_year",
+    "return_id",
+    "filing_type",
+    "ein",
+    "tax_period",
+    "sub_date",
+    "taxpayer_name",
+    "return_type",
+    "dln",
+]
+
+UPSERT_BATCH_SIZE = 10000
+
+SCHEMA_VERSION_QUERY = """
+update filing_filing set schema_version = versions.schema_version
+from unnest(%s::text[], %s::text[]) as versions (object_id, schema_version)
+where filing_filing.object_id = versions.object_id
+and filing_filing.schema_version is distinct from versions.schema_version
+"""
+
+
+def read_schema_version(object_id, year=None):
+    """
+    Read just the top of a filing and pull the schema version out of it.
+    Returns None if it isn't there, and raises FileNotFoundError if the
+    filing is missing.
+    """
+    with open_filing(object_id, year) as infile:
+        top = infile.read(VERSION_HEADER_SIZE)
+    result = VERSION_RE.search(top.decode("utf-8", "ignore"))
+    if result:
+        return result.group(1)
+    return None
+
+
+class FilingManager(models.Manager):
+    def bulk_upsert(self, rows, update_fields=None, batch_size=UPSERT_BATCH_SIZE):
+        """
+        Insert filings, or update update_fields where the object_id is
+        already entered. With no update_fields existing rows are left alone.
+        rows can be Filing instances or dicts of field values.
+        """
+        filings = [
+            row if isinstance(row, self.model) else self.model(**row) for row in rows
+        ]
+        if update_fields:
+            return self.bulk_create(
+                filings,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=["object_id"],
+                update_fields=update_fields,
+            )
+        return self.bulk_create(filings, batch_size=batch_size, ignore_conflicts=True)
+
+    def set_schema_versions(self, versions):
+        """
+        Set schema_version from a dict of {object_id: schema_version}.
+        Returns the number of filings that changed.
+        """
+        if connections[self.db].vendor == "postgresql":
+            with connections[self.db].cursor() as cursor:
+                cursor.execute(
+                    SCHEMA_VERSION_QUERY,
+                    [list(versions.keys()), list(versions.values())],
+                )
+                return cursor.rowcount
+
+        # elsewhere, one update per version; there are only a handful
+        object_ids_by_version = {}
+        for object_id, schema_version in versions.items():
+            object_ids_by_version.setdefault(schema_version, []).append(object_id)
+        updated = 0
+        with transaction.atomic(using=self.db):
+            for schema_version, object_ids in object_ids_by_version.items():
+                for i in range(0, len(object_ids), UPSERT_BATCH_SIZE):
+                    updated += (
+                        self.filter(object_id__in=object_ids[i : i + UPSERT_BATCH_SIZE])
+                        .exclude(schema_version=schema_version)
+                        .update(schema_version=schema_version)
+                    )
+        return updated
+
+    def for_load(self, year, eins=None):
+        """
+        The filings a load of this year, and optionally these eins, covers.
+        Stubs are left out until they're filled in.
+        """
+        filings = self.filter(submission_year=year).exclude(STUB)
+        if eins:
+            filings = filings.filter(ein__in=eins)
+        return filings
+
+    def claim_batch(self, year, n, worker_id, eins=None):
+        """
+        Mark up to n unparsed filings from a year as started by worker_id
+        and return them. Rows another worker has locked are skipped, so
+        any number of loaders can claim work at the same time.
+        """
+        if connections[self.db].vendor == "postgresql":
+            params = [worker_id, year]
+            ein_filter = ""
+            if eins:
+                ein_filter = "and ein = any(%s)"
+                params.append(list(eins))
+            params.append(n)
+            query = CLAIM_QUERY.format(ein_filter=ein_filter)
+            return list(self.raw(query, params))
+
+        # no SKIP LOCKED elsewhere, lock what we can in a transaction
+        with transaction.atomic(using=self.db):
+            filings = (
+                self.for_load(year, eins).filter(UNPARSED).exclude(parse_started=True)
+            )
+            filings = list(filings.order_by("id").select_for_update()[:n])
+            self.filter(id__in=[f.id for f in filings]).update(
+                parse_started=True, parse_worker=worker_id
+            )
+        return filings
 
 
 class Filing(models.Model):
@@ -82,6 +235,12 @@ class Filing(models.Model):
     parse_complete = models.BooleanField(
         null=True, help_text="Set true when data stored"
     )
+    parse_worker = models.CharField(
+        max_length=255,
+        blank=True,
+        null=True,
+        help_text="Loader that claimed this filing, as host:pid",
+    )
     process_time = models.DateTimeField(
         null=True, help_text="When was parsing complete?"
     )
@@ -93,40 +252,130 @@ class Filing(models.Model):
     )
     error_details = models.TextField(null=True, help_text="Describe error condition")
 
+    objects = FilingManager()
+
     def get_aws_URL(self):
-        return "https://s3.amazonaws.com/irs-form-990/%s_public.xml" % self.object_id
+        return "%s%s_public.xml" % (XML_BASE_URL, self.object_id)
+
+    def get_tax_year(self):
+        """tax_year if it's been set, otherwise the year of the tax period"""
+        if self.tax_year:
+            return self.tax_year
+        if self.tax_period:
+            return self.tax_period // 100
+        return None
 
     def get_local_URL(self):
-        return os.path.join(XML_DIR, "%s_public.xml" % self.object_id)
+        """Where the filing's stored, compressed or not, or where it'd go"""
+        return find_xml(self.object_id) or get_xml_path(self.object_id)
 
     def set_schema_version(self):
         """
         Sets the schema version by trying to read top of file locally.
-        Efficient b/c it doesn't parse xml, just runs regex on files second line.
+        Efficient b/c it doesn't parse xml, just runs regex on the top of the file.
         Doesn't set if file is missing.
         """
-        filepath = self.get_local_URL()
         try:
-            infile = open(filepath, "r")
+            schema_version = read_schema_version(self.object_id, self.submission_year)
         except FileNotFoundError:
-            print("File %s is missing, quitting" % filepath)
+            print("File %s is missing, quitting" % self.get_local_URL())
             return False
-        top = infile.read(1024)
-        infile.close()
-        returnline = top.split("\n")[1]
-        result = VERSION_RE.search(returnline)
-        if result:
-            if result != self.schema_version:
-                self.schema_version = result.group(1)
-                self.save()
+        if schema_version:
+            if schema_version != self.schema_version:
+                self.schema_version = schema_version
+                self.save(update_fields=["schema_version"])
         else:
-            print(
-                "No result in object_id: %s returnline:%s"
-                % (self.object_id, returnline)
-            )
+            print("No schema version found in object_id: %s" % self.object_id)
 
     class Meta:
         managed = True
+        constraints = [
+            models.UniqueConstraint(fields=["object_id"], name="filing_object_id_uniq"),
+        ]
         indexes = [
-            models.Index(fields=["object_id"]),
+            # keeps claiming a batch cheap however much of the year is loaded
+            models.Index(
+                fields=["submission_year", "id"],
+                condition=UNPARSED,
+                name="filing_unparsed_idx",
+            ),
         ]
+
+
+class LoadRun(models.Model):
+    """One run of load_filings, so an interrupted run can be resumed."""
+
+    submission_year = models.IntegerField(help_text="Index file year being loaded")
+    eins = models.TextField(
+        blank=True,
+        default="",
+        help_text="Comma separated EINs the run is limited to. Blank for all",
+    )
+    started = models.DateTimeField(auto_now_add=True, help_text="When the run began")
+    finished = models.DateTimeField(
+        null=True, help_text="When every filing in scope was loaded"
+    )
+    atomic = models.BooleanField(
+        default=False,
+        help_text="Were batches written in one transaction with their status",
+    )
+    batch_count = models.IntegerField(default=0, help_text="Batches committed")
+    filing_count = models.IntegerField(default=0, help_text="Filings committed")
+
+    def get_eins(self):
+        if self.eins:
+            return set(self.eins.split(","))
+        return set()
+
+    def __str__(self):
+        return "Load run %s of %s" % (self.id, self.submission_year)
+
+
+class LoadBatch(models.Model):
+    """A checkpoint: one batch of filings committed by a loader."""
+
+    run = models.ForeignKey(LoadRun, on_delete=models.CASCADE, related_name="batches")
+    worker = models.CharField(max_length=255, help_text="Loader, as host:pid")
+    filing_count = models.IntegerField(help_text="Filings in the batch")
+    first_filing_id = models.IntegerField(help_text="Lowest Filing id in the batch")
+    last_filing_id = models.IntegerField(help_text="Highest Filing id in the batch")
+    committed = models.DateTimeField(
+        auto_now_add=True, help_text="When the batch was committed"
+    )
+
+
+class IndexUpdate(models.Model):
+    """How far incremental_update had got through a year's index file."""
+
+    submission_year = models.IntegerField(help_text="Index file year")
+    checked = models.DateTimeField(
+        auto_now_add=True, help_text="When the index was checked"
+    )
+    index_rows = models.IntegerField(help_text="Rows in the index file")
+    new_filings = models.IntegerField(help_text="Filings entered by this update")
+    last_object_id = models.CharField(
+        max_length=18,
+        blank=True,
+        default="",
+        help_text="Highest object_id entered for the year",
+    )
+
+    def __str__(self):
+        return "Index update of %s on %s" % (self.submission_year, self.checked)
+
+
+class DroppedIndex(models.Model):
+    """
+    An index load_filings --bulk-mode dropped from a return table. Kept
+    until the index is built again, so an interrupted load can restore it.
+    """
+
+    table_name = models.CharField(max_length=63, help_text="Table it indexes")
+    index_name = models.CharField(max_length=63, unique=True)
+    definition = models.TextField(help_text="The CREATE INDEX statement")
+    dropped = models.DateTimeField(
+        auto_now_add=True, help_text="When the index was dropped"
+    )
+
+    def __str__(self):
+        return "Dropped index %s on %s" % (self.index_name, self.table_name)
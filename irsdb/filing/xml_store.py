@@ -0,0 +1,285 @@
+"""
+Filings can be kept in the working directory as plain xml, or compressed
+with gzip or zstd alongside it as <object_id>_public.xml.gz or .zst.
+They can also be packed into one archive per year, filings_<year>.pack,
+with an index of where each filing starts in filings_<year>.idx.
+Anything that reads a filing goes through here, so it doesn't matter which.
+
+zstd needs the zstandard package, `pip install irsdb[zstd]`.
+"""
+
+import gzip
+import io
+import mmap
+import os
+import shutil
+import struct
+
+from irsx import settings as irsx_settings
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+XML_DIR = irsx_settings.WORKING_DIRECTORY
+
+# compression: file suffix, in the order they're looked for
+COMPRESSIONS = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+# An archive index is a run of these: object_id, offset, length, compression
+OBJECT_ID_LENGTH = 18
+ARCHIVE_RECORD = struct.Struct("<%dsQIB" % OBJECT_ID_LENGTH)
+# How compression is recorded in the index
+COMPRESSION_CODES = {None: 0, "gzip": 1, "zstd": 2}
+
+
+def get_xml_path(object_id):
+    """Where a filing's plain xml goes"""
+    return os.path.join(XML_DIR, "%s_public.xml" % object_id)
+
+
+def find_xml(object_id):
+    """The path a filing is stored at, compressed or not, or None if it's missing"""
+    path = get_xml_path(object_id)
+    if os.path.exists(path):
+        return path
+    for suffix in COMPRESSIONS.values():
+        if os.path.exists(path + suffix):
+            return path + suffix
+    return None
+
+
+def get_compression(path):
+    for compression, suffix in COMPRESSIONS.items():
+        if path.endswith(suffix):
+            return compression
+    return None
+
+
+def open_compressed(path, mode, compression, level=None):
+    if compression == "gzip":
+        if level is None:
+            return gzip.open(path, mode)
+        return gzip.open(path, mode, compresslevel=level)
+    if zstandard is None:
+        raise RuntimeError("Reading or writing %s needs the zstandard package" % path)
+    cctx = None
+    if level is not None:
+        cctx = zstandard.ZstdCompressor(level=level)
+    return zstandard.open(path, mode, cctx=cctx)
+
+
+def open_xml(path):
+    """Open a stored filing to read its bytes, decompressing if need be"""
+    compression = get_compression(path)
+    if compression:
+        return open_compressed(path, "rb", compression)
+    return open(path, "rb")
+
+
+def compress_xml(path, compression="gzip", level=None):
+    """
+    Replace a plain xml file with a compressed copy and return its path.
+    The original is only removed once the copy is complete.
+    """
+    compressed_path = path + COMPRESSIONS[compression]
+    partial_path = compressed_path + ".part"
+    try:
+        with open(path, "rb") as infile, open_compressed(
+            partial_path, "wb", compression, level
+        ) as outfile:
+            shutil.copyfileobj(infile, outfile)
+    except BaseException:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+    os.replace(partial_path, compressed_path)
+    os.remove(path)
+    return compressed_path
+
+
+def compress_bytes(data, compression, level=None):
+    if compression == "gzip":
+        if level is None:
+            return gzip.compress(data)
+        return gzip.compress(data, compresslevel=level)
+    if zstandard is None:
+        raise RuntimeError("zstd compression needs the zstandard package")
+    if level is None:
+        return zstandard.ZstdCompressor().compress(data)
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+def decompress_bytes(data, compression):
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if zstandard is None:
+        raise RuntimeError("zstd compression needs the zstandard package")
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+def get_archive_paths(year):
+    """The archive and index for a year"""
+    return (
+        os.path.join(XML_DIR, "filings_%s.pack" % year),
+        os.path.join(XML_DIR, "filings_%s.idx" % year),
+    )
+
+
+def read_archive_index(index_path):
+    """Returns {object_id: (offset, length, compression)}"""
+    compressions = {code: name for name, code in COMPRESSION_CODES.items()}
+    with open(index_path, "rb") as infile:
+        data = infile.read()
+    # ignore a record cut short by a crash while the index was written
+    data = data[: len(data) - len(data) % ARCHIVE_RECORD.size]
+    return {
+        # struct pads object_ids shorter than the field with NULs
+        object_id.rstrip(b"\0").decode("ascii"): (offset, length, compressions[code])
+        for object_id, offset, length, code in ARCHIVE_RECORD.iter_unpack(data)
+    }
+
+
+class FilingArchive(object):
+    """
+    Reads filings out of a year's archive. The archive is mmapped, so
+    reading an uncompressed filing doesn't copy it.
+    """
+
+    def __init__(self, year):
+        self.path, self.index_path = get_archive_paths(year)
+        self.index = read_archive_index(self.index_path)
+        self.file = open(self.path, "rb")
+        self.mmap = None
+        if os.fstat(self.file.fileno()).st_size:
+            self.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __contains__(self, object_id):
+        return object_id in self.index
+
+    def read(self, object_id):
+        """A filing's xml, as a memoryview or bytes"""
+        offset, length, compression = self.index[object_id]
+        data = memoryview(self.mmap)[offset : offset + length]
+        if compression:
+            return decompress_bytes(data, compression)
+        return data
+
+    def close(self):
+        if self.mmap:
+            self.mmap.close()
+        self.file.close()
+
+
+class ArchiveWriter(object):
+    """
+    Appends filings to a year's archive. Members are synced to disk
+    before their index records are written, so the index never points
+    past what's safely in the archive.
+    """
+
+    def __init__(self, year, compression=None, level=None):
+        self.compression = compression
+        self.level = level
+        self.path, self.index_path = get_archive_paths(year)
+        self.index = {}
+        if os.path.exists(self.index_path):
+            self.index = read_archive_index(self.index_path)
+        self.archive = open(self.path, "ab")
+        self.archive.seek(0, os.SEEK_END)
+        self.index_file = open(self.index_path, "ab")
+        self.index_file.truncate(len(self.index) * ARCHIVE_RECORD.size)
+        self.index_file.seek(0, os.SEEK_END)
+        self.pending = []
+
+    def __contains__(self, object_id):
+        return object_id in self.index
+
+    def add(self, object_id, data):
+        encoded_id = object_id.encode("ascii")
+        # struct would silently cut a longer one short
+        if len(encoded_id) > OBJECT_ID_LENGTH:
+            raise ValueError("%s is too long to be an object_id" % object_id)
+        if self.compression:
+            data = compress_bytes(data, self.compression, self.level)
+        offset = self.archive.tell()
+        self.archive.write(data)
+        self.index[object_id] = (offset, len(data), self.compression)
+        self.pending.append(
+            ARCHIVE_RECORD.pack(
+                encoded_id,
+                offset,
+                len(data),
+                COMPRESSION_CODES[self.compression],
+            )
+        )
+
+    def commit(self):
+        """Make everything added so far durable"""
+        self.archive.flush()
+        os.fsync(self.archive.fileno())
+        self.index_file.write(b"".join(self.pending))
+        self.index_file.flush()
+        os.fsync(self.index_file.fileno())
+        self.pending = []
+
+    def close(self):
+        self.commit()
+        self.archive.close()
+        self.index_file.close()
+
+
+# Each process opens a year's archive once; None if there isn't one
+archives = {}
+
+
+def get_archive(year):
+    try:
+        return archives[year]
+    except KeyError:
+        archive = None
+        if os.path.exists(get_archive_paths(year)[1]):
+            archive = FilingArchive(year)
+        archives[year] = archive
+        return archive
+
+
+def in_archive(object_id, year):
+    archive = get_archive(year) if year else None
+    return archive is not None and object_id in archive
+
+
+def filing_exists(object_id, year=None):
+    return in_archive(object_id, year) or find_xml(object_id) is not None
+
+
+def open_filing(object_id, year=None):
+    """
+    Open a filing to read its bytes, from the year's archive if it's in
+    there and from the working directory if not.
+    """
+    if in_archive(object_id, year):
+        return io.BytesIO(get_archive(year).read(object_id))
+    path = find_xml(object_id)
+    if path is None:
+        raise FileNotFoundError(get_xml_path(object_id))
+    return open_xml(path)
+
+
+def read_filing(object_id, year=None):
+    """
+    A filing's xml, from the year's archive if it's in there and from the
+    working directory if not. Uncompressed archive members come back as a
+    memoryview of the archive, without a copy.
+    """
+    if in_archive(object_id, year):
+        return get_archive(year).read(object_id)
+    path = find_xml(object_id)
+    if path is None:
+        raise FileNotFoundError(get_xml_path(object_id))
+    with open_xml(path) as infile:
+        return infile.read()
@@ -12,6 +12,18 @@ GENERATED_MODELS_DIR = settings.GENERATED_MODELS_DIR
 CANONICAL_VERSION = "2016v3.0"
 soft_tab = "    "
 
+PARTITION_MIGRATION_TOP = """from django.db import migrations
+
+from irsdb.schemas.partitions import PartitionByYear
+
+
+class Migration(migrations.Migration):
+    # point this at the return app's latest migration
+    dependencies = [("return", "0001_initial")]
+
+    operations = [
+"""
+
 
 class Command(BaseCommand):
     help = """  Generate django model file.
@@ -24,6 +36,11 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument("--sqlalchemy", action="store_true")
+        parser.add_argument(
+            "--partition",
+            action="store_true",
+            help="Also write a migration that partitions the tables by submission_year",
+        )
 
         parser.add_argument(
             "--schedule",
@@ -53,6 +70,21 @@ class Command(BaseCommand):
                 soft_tab
                 + 'ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")\n'
             )
+            result += (
+                soft_tab
+                + 'submission_year = models.IntegerField(blank=True, null=True, help_text="index year")\n'  # noqa
+            )
+            # no database constraint, so the return tables can be loaded,
+            # rewritten or made unlogged without regard to filing_filing, and
+            # no index, which every load would pay to maintain
+            result += (
+                soft_tab
+                + 'filing = models.ForeignKey("filing.Filing", on_delete=models.DO_NOTHING, db_constraint=False, db_index=False, blank=True, null=True, related_name="+", help_text="filing the row is from")\n'  # noqa
+            )
+            result += (
+                soft_tab
+                + 'tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")\n'  # noqa
+            )
             if parent_sked_name == "IRS990ScheduleK":
                 # It's not clear what the max length is; Return.xsd is unclear
                 result += (
@@ -76,6 +108,9 @@ class Command(BaseCommand):
             )
             result += soft_tab + "object_id = Column(String(31))\n"
             result += soft_tab + "ein = Column(String(15))\n"
+            result += soft_tab + "submission_year = Column(Integer)\n"
+            result += soft_tab + "filing_id = Column(Integer)\n"
+            result += soft_tab + "tax_year = Column(Integer)\n"
             if parent_sked_name == "IRS990ScheduleK":
                 result += soft_tab + "documentId = Column(String(15))\n"
 
@@ -150,6 +185,7 @@ class Command(BaseCommand):
             if variables_in_this_part:
                 # only write it if it contains anything
                 self.outfile.write(model_top)
+                self.model_names.append(form_part.parent_sked_part)
                 print(model_top)
 
                 for variable in variables_in_this_part:
@@ -185,6 +221,7 @@ class Command(BaseCommand):
             if variables_in_this_group:
                 # only write it if it contains anything
                 self.outfile.write(model_top)
+                self.model_names.append(group.db_name)
                 print(model_top)
 
                 for variable in variables_in_this_group:
@@ -192,6 +229,20 @@ class Command(BaseCommand):
                     print(this_var)
                     self.outfile.write(this_var)
 
+    def write_partition_migration(self):
+        """
+        Write a migration that partitions every table just generated by
+        submission_year. Copy it into irsdb/return/migrations after the
+        migration that creates the tables.
+        """
+        file_output = os.path.join(GENERATED_MODELS_DIR, "django_partitions_auto.py")
+        print("Writing partition migration to %s" % file_output)
+        with open(file_output, "w") as outfile:
+            outfile.write(PARTITION_MIGRATION_TOP)
+            for model_name in self.model_names:
+                outfile.write(soft_tab * 2 + 'PartitionByYear("%s"),\n' % model_name)
+            outfile.write(soft_tab + "]\n")
+
     def handle(self, *args, **options):
         print(options)
         self.run_sqlalchemy = options["sqlalchemy"]
@@ -203,6 +254,7 @@ class Command(BaseCommand):
                 GENERATED_MODELS_DIR, "sqlalchemy_models_auto.py"
             )
         self.outfile = open(file_output, "w")
+        self.model_names = []
 
         self.write_top_matter()
 
@@ -214,3 +266,6 @@ class Command(BaseCommand):
             for schedulename in KNOWN_SCHEDULES:
                 print("Handling schedule %s" % schedulename)
                 self.write_sked(schedulename)
+
+        if options["partition"] and self.run_django:
+            self.write_partition_migration()
@@ -0,0 +1,84 @@
+import timeit
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from irsdb.schemas.row_adapters import get_registry
+
+
+class Command(BaseCommand):
+    help = """
+    Time the per-row work the accumulator does on the way to the database:
+    looking up the model for a part or group name, and turning the row irsx
+    returns into something a writer can store, and sanitizing it.
+    """
+
+    # rows are cleaned a buffer at a time
+    batch_size = 1000
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            dest="model",
+            default="SkdBCntrbtrInfrmtn",
+            help="Part or group name to use, as irsx reports it",
+        )
+        parser.add_argument(
+            "--rows", dest="rows", type=int, default=100000, help="Rows to time"
+        )
+
+    def get_row(self, adapter):
+        """A made up row with a value in every column, some of them redacted"""
+        row = {}
+        for field in adapter.fields:
+            if field.get_internal_type().endswith("IntegerField"):
+                row[field.attname] = "1234"
+            else:
+                row[field.attname] = "X"
+        for index, max_length in adapter.text_columns[:1]:
+            row[adapter.attnames[index]] = "XXX-XX-XXXX"
+        for index, coerce in adapter.numeric_columns[:1]:
+            row[adapter.attnames[index]] = "RESTRICTED"
+        return row
+
+    def report(self, label, seconds, rows):
+        print("%-40s %8.0f ns/row" % (label, seconds / rows * 1e9))
+
+    def handle(self, *args, **options):
+        name = options["model"]
+        rows = options["rows"]
+
+        registry = get_registry()
+        adapter = registry.get(name)
+        model = adapter.model
+        row = self.get_row(adapter)
+        print("%s rows of %s, %s columns" % (rows, name, len(adapter.fields)))
+
+        self.report(
+            "apps.get_model (cache miss)",
+            timeit.timeit(lambda: apps.get_model("return", name), number=rows),
+            rows,
+        )
+        self.report(
+            "registry lookup",
+            timeit.timeit(lambda: registry.get(name), number=rows),
+            rows,
+        )
+        self.report(
+            "model(**row)",
+            timeit.timeit(lambda: model(**row), number=rows),
+            rows,
+        )
+        self.report(
+            "adapter.adapt(row)",
+            timeit.timeit(lambda: adapter.adapt(row), number=rows),
+            rows,
+        )
+        batch = [adapter.adapt(row)] * self.batch_size
+        self.report(
+            "adapter.clean(rows)",
+            timeit.timeit(
+                lambda: adapter.clean(batch), number=max(rows // self.batch_size, 1)
+            ),
+            rows,
+        )
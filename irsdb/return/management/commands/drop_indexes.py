@@ -1,19 +1,22 @@
 from django.core.management.base import BaseCommand
 from django.db import connection
 
+from irsdb.schemas.index_builder import get_index_prefixes
+from irsdb.schemas.partitions import get_return_tables
+
 
 class Command(BaseCommand):
     help = """
-    remove all filings from a given year by object id. This is faster if indexes are created already.
+    Drop the indexes make_indexes creates, from every profile.
     """
 
     def handle(self, *args, **options):
         self.cursor = connection.cursor()
 
-        all_tables = connection.introspection.table_names()
-        for table in all_tables:
-            if table.startswith("return"):
-                index_name = "xx_%s" % table
+        # partitions are covered by their parent table
+        for table in get_return_tables(self.cursor):
+            for prefix in get_index_prefixes():
+                index_name = "%s_%s" % (prefix, table)
                 query = "drop index if exists %s" % (index_name)
                 print("Running query: '%s' " % query)
                 self.cursor.execute(query)
@@ -1,25 +1,27 @@
 import csv
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 from django.core.management.base import BaseCommand
-from irsx.filing import FileMissingException, InvalidXMLException
-from irsx.xmlrunner import XMLRunner
+from django.db import connections
 
-from irsdb.filing.models import Filing
-from irsdb.schemas.model_accumulator import Accumulator
-
-# from irs_reader.filing import FileMissingException
-
-
-# this is how many we process; there's a separate batch size
-# in model accumulator for how many are processed
-BATCH_SIZE = 1000
+from irsdb.filing.models import Filing, LoadRun
+from irsdb.schemas.bulk_mode import enter_bulk_mode, leave_bulk_mode
+from irsdb.schemas.filing_loader import (
+    FilingLoader,
+    init_worker,
+    release_unfinished,
+    run_worker,
+)
+from irsdb.schemas.model_writers import WRITERS
+from irsdb.schemas.partitions import create_year_partitions
 
 
 class Command(BaseCommand):
     help = """
     Enter the filings, one by one.
-    Loading is done in bulk, though status on the filings is updated one at a time.
+    Loading is done in bulk, and status on the filings is updated once per batch.
+    With --workers, filings are parsed and loaded by a pool of processes.
     """
 
     def add_arguments(self, parser):
@@ -28,71 +30,139 @@ class Command(BaseCommand):
         parser.add_argument(
             "--file", dest="file", help="Path of CSV file to import", required=False
         )
+        parser.add_argument(
+            "--workers",
+            dest="workers",
+            type=int,
+            default=1,
+            help="Number of loader processes to run",
+        )
+        parser.add_argument(
+            "--writer",
+            dest="writer",
+            choices=WRITERS.keys(),
+            default=None,
+            help="How rows are written. Defaults to copy on postgres",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue the last unfinished run for this year and file",
+        )
+        parser.add_argument(
+            "--new-only",
+            dest="new_only",
+            action="store_true",
+            help="Only load filings that haven't been loaded, leave the rest alone. "
+            "Filings a crashed load had claimed are loaded again, so don't run it "
+            "alongside another load of the same year",
+        )
+        parser.add_argument(
+            "--atomic",
+            action="store_true",
+            help="Write each batch and its filing status in one transaction",
+        )
+        parser.add_argument(
+            "--max-buffered-rows",
+            dest="max_buffered_rows",
+            type=int,
+            default=None,
+            help="Most return rows each loader holds in memory before writing",
+        )
+        parser.add_argument(
+            "--prefetch",
+            dest="prefetch",
+            type=int,
+            default=0,
+            help="Download missing xml over this many connections ahead of parsing",
+        )
+        parser.add_argument(
+            "--result-cache",
+            dest="result_cache",
+            default=None,
+            help="Directory to keep parsed filings in, to skip parsing next time",
+        )
+        parser.add_argument(
+            "--result-cache-mb",
+            dest="result_cache_mb",
+            type=int,
+            default=10240,
+            help="Most space the result cache can take up, in MB",
+        )
+        parser.add_argument(
+            "--bulk-mode",
+            dest="bulk_mode",
+            action="store_true",
+            help="Drop the return tables' indexes for the load and rebuild them "
+            "after, and don't wait on each commit. Postgres only",
+        )
+        parser.add_argument(
+            "--unlogged",
+            action="store_true",
+            help="With --bulk-mode, make the tables unlogged during the load. "
+            "If postgres crashes meanwhile, those tables are emptied",
+        )
 
-    def setup(self):
-        # get an XMLRunner -- this is what actually does the parsing
-        self.xml_runner = XMLRunner()
-        self.accumulator = Accumulator()
-
-    def process_sked(self, sked):
-        """Enter just one schedule"""
-        print("Processing schedule %s" % sked["schedule_name"])
-        for part in sked["schedule_parts"].keys():
-            partname = part
-            partdata = sked["schedule_parts"][part]
-            print("part %s %s" % (partname, partdata))
-
-            self.accumulator.add_model(partname, partdata)
-
-        for groupname in sked["groups"].keys():
-            for groupdata in sked["groups"][groupname]:
-                # print("group %s %s" % (groupname, groupdata) )
-                self.accumulator.add_model(groupname, groupdata)
-
-    def run_filing(self, filing):
-        object_id = filing.object_id
+    def get_run(self, year, eins, resume, atomic, new_only=False):
+        ein_list = ",".join(sorted(eins))
+        if not resume:
+            if new_only:
+                # a crashed load's claims would otherwise never be loaded
+                released = release_unfinished(year, eins, crashed_only=True)
+                if released:
+                    print("Released %s filings a crashed load had claimed" % released)
+            else:
+                # start over, but only for the filings in this run's scope.
+                # process_time goes too, or --new-only would take a filing
+                # a crashed run had claimed for one from a completed batch
+                Filing.objects.for_load(year, eins).update(
+                    parse_complete=False,
+                    parse_started=False,
+                    parse_worker=None,
+                    process_time=None,
+                )
+            return LoadRun.objects.create(
+                submission_year=year, eins=ein_list, atomic=atomic
+            )
 
-        try:
-            parsed_filing = self.xml_runner.run_filing(object_id)
-        except InvalidXMLException:
-            parsed_filing = None
-
-        if not parsed_filing:
-            print(
-                "Skipping filing %s(filings with pre-2013 filings are skipped)\n row details:"
-                % (filing,)
+        run = (
+            LoadRun.objects.filter(
+                submission_year=year, eins=ein_list, finished__isnull=True
             )
-            return None
-
-        # schedule_list = parsed_filing.list_schedules()
-        # print("sked list is %s" % schedule_list)
-
-        result = parsed_filing.get_result()
-
-        keyerrors = parsed_filing.get_keyerrors()
-        schema_version = parsed_filing.get_version()
-        # This could be disabled if we don't care about the schema version
-        # This is one save per loaded row...
-        if filing.schema_version != schema_version:
-            filing.schema_version = schema_version
-            filing.save()
-
-        if keyerrors:
-            # If we find keyerrors--xpaths that are missing from our spec, note it
-            print("Key error %s")
-            has_keyerrors = len(keyerrors) > 0
-            print("keyerror: %s" % keyerrors)
-            filing.error_details = str(keyerrors)
-            filing.key_error_count = len(keyerrors)
-            filing.is_error = has_keyerrors
-            filing.save()
-
-        if result:
-            for sked in result:
-                print(sked)
-                self.process_sked(sked)
-        else:
-            print("Filing not parsed %s " % object_id)
+            .order_by("-id")
+            .first()
+        )
+        if not run:
+            raise RuntimeError("No unfinished run for %s to resume" % year)
+        print(
+            "Resuming run %s: %s filings in %s batches already committed"
+            % (run.id, run.filing_count, run.batch_count)
+        )
+        # rows from an atomic batch are only ever committed with their status
+        release_unfinished(year, eins, remove_rows=not run.atomic)
+        run.atomic = atomic
+        run.save(update_fields=["atomic"])
+        return run
+
+    def run_pool(self, year, workers, loader_options):
+        # Each worker opens its own connection; don't share ours across a fork
+        connections.close_all()
+        process_count = 0
+        missing_filings = 0
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker
+        ) as executor:
+            futures = [
+                executor.submit(run_worker, year, **loader_options)
+                for i in range(workers)
+            ]
+            for future in futures:
+                count, missing = future.result()
+                process_count += count
+                missing_filings += missing
+
+        print("Processed a total of %s filings" % process_count)
+        print("Total missing files: %s" % missing_filings)
 
     def handle(self, *args, **options):
 
@@ -114,12 +184,15 @@ class Command(BaseCommand):
                 "Illegal year `%s`. Please enter a year between 2014 and 2024" % year
             )
 
-        print("Running filings during year %s" % year)
-        self.setup()
+        if (
+            options["max_buffered_rows"] is not None
+            and options["max_buffered_rows"] < 1
+        ):
+            raise RuntimeError("--max-buffered-rows must be at least 1")
+        if options["unlogged"] and not options["bulk_mode"]:
+            raise RuntimeError("--unlogged only works with --bulk-mode")
 
-        process_count = 0
-        missing_filings = 0
-        missed_file_list = []
+        print("Running filings during year %s" % year)
 
         eins = set()
 
@@ -129,46 +202,41 @@ class Command(BaseCommand):
                 for row in reader:
                     eins.add(row["ein"].zfill(9))
 
-        Filing.objects.update(parse_complete=False, parse_started=False)
-        while True:
-            if eins:
-                filings = Filing.objects.filter(
-                    submission_year=year, ein__in=eins
-                ).exclude(parse_complete=True)[:100]
+        atomic = options["atomic"]
+        if options["resume"] and options["new_only"]:
+            raise RuntimeError("Use either --resume or --new-only, not both")
+        run = self.get_run(year, eins, options["resume"], atomic, options["new_only"])
+
+        partitioned = create_year_partitions(year)
+        if partitioned:
+            print("%s partitioned tables ready for %s" % (len(partitioned), year))
+
+        bulk_mode = options["bulk_mode"]
+        if bulk_mode:
+            enter_bulk_mode(year, unlogged=options["unlogged"])
+
+        loader_options = {
+            "eins": eins,
+            "writer": options["writer"],
+            "run_id": run.id,
+            "atomic": atomic,
+            "max_buffered_rows": options["max_buffered_rows"],
+            "prefetch": options["prefetch"],
+            "result_cache": options["result_cache"],
+            "result_cache_bytes": options["result_cache_mb"] * 1024 * 1024,
+            "bulk_mode": bulk_mode,
+        }
+        workers = options["workers"]
+        try:
+            if workers > 1:
+                self.run_pool(year, workers, loader_options)
             else:
-                filings = Filing.objects.filter(submission_year=year).exclude(
-                    parse_complete=True
-                )[:100]
-
-            if not filings:
-                print("Done")
-                break
-
-            object_id_list = [f.object_id for f in filings]
-
-            # record that processing has begun
-            Filing.objects.filter(object_id__in=object_id_list).update(
-                parse_started=True
-            )
-
-            for filing in filings:
-                print("Handling id %s" % filing.object_id)
-                try:
-                    self.run_filing(filing)
-                except FileMissingException:
-                    print("File missing %s, skipping" % filing.object_id)
-                    missing_filings += 1
-                    missed_file_list.append(filing.object_id)
-                process_count += 1
-                if process_count % 1000 == 0:
-                    print("Handled %s filings" % process_count)
-
-            # commit anything that's left
-            self.accumulator.commit_all()
-            # record that all are complete
-            Filing.objects.filter(object_id__in=object_id_list).update(
-                process_time=datetime.now(), parse_complete=True
-            )
-            print("Processed a total of %s filings" % process_count)
-            print("Total missing files: %s" % missing_filings)
-            print("Missing %s" % missed_file_list)
+                FilingLoader(year, **loader_options).run()
+        finally:
+            # put the indexes back even if the load failed, so the tables
+            # aren't left without them
+            if bulk_mode:
+                leave_bulk_mode()
+
+        run.finished = datetime.now()
+        run.save(update_fields=["finished"])
@@ -1,29 +1,65 @@
 from django.core.management.base import BaseCommand
 from django.db import connection
 
+from irsdb.schemas.index_builder import (
+    DEFAULT_PROFILES,
+    INDEX_PROFILES,
+    MAINTENANCE_WORK_MEM,
+    WORKERS,
+    build_indexes,
+    get_profile_indexes,
+)
+from irsdb.schemas.partitions import get_partitioned_tables, get_return_tables
+
 
 class Command(BaseCommand):
     help = """
-    remove all filings from a given year by object id. This is faster if indexes are created already.
+    Create indexes on every return table, named <prefix>_<tablename>. The btree profile,
+    the default, indexes object_id and ein (and documentId on schedule K); brin indexes
+    id, which follows load order; hash indexes object_id. Indexes that already exist are skipped.
     """
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--profile",
+            dest="profiles",
+            action="append",
+            choices=INDEX_PROFILES.keys(),
+            help="Which indexes to build; can be given more than once",
+        )
+        parser.add_argument(
+            "--workers",
+            dest="workers",
+            type=int,
+            default=WORKERS,
+            help="Number of indexes to build at once",
+        )
+        parser.add_argument(
+            "--maintenance-work-mem",
+            dest="maintenance_work_mem",
+            default=MAINTENANCE_WORK_MEM,
+            help="maintenance_work_mem for each build, e.g. 512MB",
+        )
+        parser.add_argument(
+            "--concurrently",
+            action="store_true",
+            help="Build without locking out writes; slower",
+        )
+
     def handle(self, *args, **options):
-        self.cursor = connection.cursor()
+        if options["workers"] < 1:
+            raise RuntimeError("--workers must be at least 1")
 
-        all_tables = connection.introspection.table_names()
-        for table in all_tables:
-            if table.startswith("return"):
-                index_name = "xx_%s" % table
-                if table.startswith("return_skdk"):
-                    query = 'create index %s on %s (object_id, ein, "documentId")' % (
-                        index_name,
-                        table,
-                    )
+        with connection.cursor() as cursor:
+            # partitions are covered by their parent table
+            tables = get_return_tables(cursor)
+            partitioned = get_partitioned_tables(cursor)
 
-                else:
-                    query = "create index %s on %s (object_id, ein)" % (
-                        index_name,
-                        table,
-                    )
-                print("Running query: '%s' " % query)
-                self.cursor.execute(query)
+        indexes = get_profile_indexes(tables, options["profiles"] or DEFAULT_PROFILES)
+        build_indexes(
+            indexes,
+            workers=options["workers"],
+            maintenance_work_mem=options["maintenance_work_mem"],
+            concurrently=options["concurrently"],
+            partitioned=partitioned,
+        )
@@ -1,48 +1,112 @@
 from django.core.management.base import BaseCommand
 from django.db import connection
 
+from irsdb.filing.models import Filing
+from irsdb.schemas.partitions import (
+    drop_year_partitions,
+    get_default_partition_name,
+    get_partitioned_tables,
+    get_return_tables,
+)
+from irsdb.schemas.row_removal import (
+    CONNECTIONS,
+    REWRITE_FRACTION,
+    estimate_removed_fractions,
+    remove_rows,
+    reset_filings,
+)
+
+STRATEGIES = ["auto", "delete", "rewrite"]
+
 
 class Command(BaseCommand):
     help = """
-    remove all filings from a given year by object id. This is faster if indexes are created already.
+    remove all filings from a given year, by the filing_id on each row.
+    Tables partitioned by submission_year just have the year's partition dropped.
+    With --strategy=rewrite, tables are copied without the year's rows and swapped in
+    instead; by default that's done for the tables where the year is a large share.
+    Tables that views depend on are always deleted from.
     """
 
     def add_arguments(self, parser):
         # Positional arguments
         parser.add_argument("year", nargs=1, type=int)
+        parser.add_argument(
+            "--connections",
+            dest="connections",
+            type=int,
+            default=CONNECTIONS,
+            help="Number of tables to delete from at once",
+        )
+        parser.add_argument(
+            "--strategy",
+            dest="strategy",
+            choices=STRATEGIES,
+            default="auto",
+            help="Delete the rows, rewrite the tables without them, or rewrite "
+            "where more than %d%% of a table is removed" % (REWRITE_FRACTION * 100),
+        )
+
+    def get_rewrites(self, cursor, strategy, tables):
+        """The tables to rewrite rather than delete from"""
+        if strategy == "rewrite":
+            return set(tables)
+        if strategy == "delete" or connection.vendor != "postgresql":
+            return set()
+
+        loaded = Filing.objects.filter(parse_complete=True)
+        loaded_count = loaded.count()
+        if not loaded_count:
+            return set()
+        filing_share = (
+            loaded.filter(submission_year=self.submission_year).count() / loaded_count
+        )
+        fractions = estimate_removed_fractions(
+            cursor, self.submission_year, filing_share
+        )
+        rewrite = {
+            table for table in tables if fractions.get(table, 0) > REWRITE_FRACTION
+        }
+        print(
+            "Rewriting %s tables where more than %d%% is removed"
+            % (len(rewrite), REWRITE_FRACTION * 100)
+        )
+        return rewrite
 
     def handle(self, *args, **options):
-        self.cursor = connection.cursor()
         self.submission_year = int(options["year"][0])
+        if options["connections"] < 1:
+            raise RuntimeError("--connections must be at least 1")
+        strategy = options["strategy"]
+        if strategy == "rewrite" and connection.vendor != "postgresql":
+            raise RuntimeError("--strategy=rewrite needs postgres")
 
-        BASE_QUERY = (
-            "(select object_id from filing_filing where submission_year=%s)"
-            % self.submission_year
-        )
+        dropped = drop_year_partitions(self.submission_year)
+        if dropped:
+            print("Dropped %s partitions for %s" % (len(dropped), self.submission_year))
+
+        with connection.cursor() as cursor:
+            partitioned = get_partitioned_tables(cursor)
+            tables = []
+            # partitions can't be swapped out, so only plain tables are rewritten
+            plain_tables = []
+            for table in get_return_tables(cursor):
+                if table in partitioned:
+                    # the year's rows were in its partition, if it had one,
+                    # so all that can be left is in the default partition
+                    table = get_default_partition_name(table)
+                else:
+                    plain_tables.append(table)
+                tables.append(table)
+            rewrite = self.get_rewrites(cursor, strategy, plain_tables)
 
-        all_tables = connection.introspection.table_names()
-        for table in all_tables:
-            if table.startswith("return"):
-                query = "delete from %s where object_id in %s" % (table, BASE_QUERY)
-                print("Running query: '%s' " % query)
-                result = self.cursor.execute(query)
-                print("Done '%s'\n" % result)
-
-        cmds = [
-            "update filing_filing set parse_started=False where  parse_started = True and submission_year=%s"
-            % self.submission_year,
-            "update filing_filing set parse_complete=False where parse_complete = True and submission_year=%s"
-            % self.submission_year,
-            "update filing_filing set process_time=Null where not process_time is Null and submission_year=%s"
-            % self.submission_year,
-            "update filing_filing set is_error=False where is_error = True and submission_year=%s"
-            % self.submission_year,
-            "update filing_filing set key_error_count=Null where not key_error_count is Null and submission_year=%s"
-            % self.submission_year,
-            "update filing_filing set error_details =Null where not error_details is Null and submission_year=%s"
-            % self.submission_year,
-        ]
-
-        for cmd in cmds:
-            print("Running query: '%s' " % cmd)
-            self.cursor.execute(cmd)
+        condition = "submission_year=%s"
+        params = [self.submission_year]
+        remove_rows(
+            tables,
+            condition,
+            params,
+            workers=options["connections"],
+            rewrite=rewrite,
+        )
+        reset_filings(condition, params)
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from irsdb.filing.models import DroppedIndex
+from irsdb.schemas.bulk_mode import leave_bulk_mode
+from irsdb.schemas.index_builder import WORKERS
+
+
+class Command(BaseCommand):
+    help = """
+    Put back what an interrupted load_filings --bulk-mode left undone: make the
+    return tables logged again, rebuild the indexes it dropped and analyze the tables.
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            dest="workers",
+            type=int,
+            default=WORKERS,
+            help="Number of indexes to build at once",
+        )
+
+    def handle(self, *args, **options):
+        print("%s dropped indexes to rebuild" % DroppedIndex.objects.count())
+        leave_bulk_mode(workers=options["workers"])
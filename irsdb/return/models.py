@@ -12,6 +12,18 @@ class part_0(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     PrncplOfcrBsnssNm_BsnssNmLn1Txt = models.CharField(
         null=True, blank=True, max_length=75
@@ -199,6 +211,18 @@ class part_i(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TtlEmplyCnt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part I Line 5  Description: total Number employees  most recent xpath: /IRS990/TotalEmployeeCnt
@@ -330,6 +354,18 @@ class part_iii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     ActvtyCd = models.BigIntegerField(null=True, blank=True)
     # Line number: Part III Line 4a  Description: Activity code  most recent xpath: /IRS990/ActivityCd
@@ -413,6 +449,18 @@ class part_iv(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     DnrAdvsdFndInd = models.TextField(null=True, blank=True)
     # Line number: Part IV Line 6  Description: Donor advised funds?  most recent xpath: /IRS990/DonorAdvisedFundInd
@@ -592,6 +640,18 @@ class part_v(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     LcnsdMrThnOnSttInd = models.CharField(null=True, blank=True, max_length=5)
     # Line number: Part V Line 13a  Description: Is the organization licensed to issue qualified health plans in more than one state?  most recent xpath: /IRS990/LicensedMoreThanOneStateInd
@@ -726,6 +786,18 @@ class part_vi(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     OthrWbstInd = models.CharField(null=True, blank=True, max_length=1)
     # Line number: Part VI Section C Line 18  Description: Other website  most recent xpath: /IRS990/OtherWebsiteInd
@@ -911,6 +983,18 @@ class part_vii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TtlRprtblCmpFrmOrgAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part VII Section A Line 1d D  Description: Total, column D  most recent xpath: /IRS990/TotalReportableCompFromOrgAmt
@@ -955,6 +1039,18 @@ class part_viii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     GnOrLss_OthrAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Part VIII Column (ii)  Description:  Other amount  most recent xpath: /IRS990/GainOrLossGrp/OtherAmt
@@ -1200,6 +1296,18 @@ class part_ix(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     OthrSlrsAndWgs_PrgrmSrvcsAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  col (B)  Description:  Program services  most recent xpath: /IRS990/OtherSalariesAndWagesGrp/ProgramServicesAmt
@@ -1583,6 +1691,18 @@ class part_x(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TtlNtAsstsFndBlnc_EOYAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Part X Column (B)  Description:  Ending of year  most recent xpath: /IRS990/TotalNetAssetsFundBalanceGrp/EOYAmt
@@ -1834,6 +1954,18 @@ class part_xi(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     InvstmntExpnsAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part XI Line 7  Description: Investment expenses  most recent xpath: /IRS990/InvestmentExpenseAmt
@@ -1869,6 +2001,18 @@ class part_xii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     MthdOfAccntngAccrlInd = models.CharField(null=True, blank=True, max_length=1)
     # Line number: Part XII Line 1  Description: Method of accounting - Accrual  most recent xpath: /IRS990/MethodOfAccountingAccrualInd
@@ -1939,6 +2083,18 @@ class SpclCndtnDsc(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     SpclCndtnDsc = models.TextField(null=True, blank=True)
     # Description: Special condition description  most recent xpath: /IRS990/SpecialConditionDesc
@@ -1957,6 +2113,18 @@ class PrgSrvcAccmActyOthr(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     ExpnsAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Part III  Description:  Expense  most recent xpath: /IRS990/ProgSrvcAccomActyOtherGrp/ExpenseAmt
@@ -1987,6 +2155,18 @@ class FrgnCntryCd(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrgnCntryCd = models.CharField(null=True, blank=True, max_length=2)
     # Line number: Part V Line 4b  Description: Name of foreign country  most recent xpath: /IRS990/ForeignCountryCd
@@ -2005,6 +2185,18 @@ class SttsWhrCpyOfRtrnIsFldCd(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     SttsWhrCpyOfRtrnIsFldCd = models.CharField(null=True, blank=True, max_length=2)
     # Line number: Part VI Section C Line 17  Description: States where return filed  most recent xpath: /IRS990/StatesWhereCopyOfReturnIsFldCd
@@ -2023,6 +2215,18 @@ class CntrctrCmpnstn(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     BsnssNm_BsnssNmLn2Txt = models.CharField(null=True, blank=True, max_length=75)
     # Line number:  Part VII Section B Line 1(A)  Description:  Business name line 2  most recent xpath: /IRS990/ContractorCompensationGrp/ContractorName/BusinessName/BusinessNameLine2Txt
@@ -2086,6 +2290,18 @@ class Frm990PrtVIISctnA(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     OffcrInd = models.CharField(null=True, blank=True, max_length=1)
     # Line number: Part VII Section A Line 1a C  Description:  Officer  most recent xpath: /IRS990/Form990PartVIISectionAGrp/OfficerInd
@@ -2146,6 +2362,18 @@ class OthrRvnMsc(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     BsnssCd = models.TextField(null=True, blank=True)
     # Line number:  Part VIII  Description:  Business code  most recent xpath: /IRS990/OtherRevenueMiscGrp/BusinessCd
@@ -2179,6 +2407,18 @@ class PrgrmSrvcRvn(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     ExclsnAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Part VIII Column (D)  Description:  Excluded by section 512, 513, or 514: amount  most recent xpath: /IRS990/ProgramServiceRevenueGrp/ExclusionAmt
@@ -2212,6 +2452,18 @@ class OthrExpnss(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     PrgrmSrvcsAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  col (B)  Description:  Program services  most recent xpath: /IRS990/OtherExpensesGrp/ProgramServicesAmt
@@ -2241,6 +2493,18 @@ class ez_part_0(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     MthdOfAccntngOthrDsc = models.CharField(null=True, blank=True, max_length=100)
     # Line number: G  Description: Method of accounting - Other  most recent xpath: /IRS990EZ/MethodOfAccountingOtherDesc
@@ -2324,6 +2588,18 @@ class ez_part_i(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     SpclEvntsNtIncmLssAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part I Line 6d  Description: Special events net income (or loss)  most recent xpath: /IRS990EZ/SpecialEventsNetIncomeLossAmt
@@ -2425,6 +2701,18 @@ class ez_part_ii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     OthrAsstsTtlDtl_BOYAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Part II - Column (A)  Description:  Beginnning of year  most recent xpath: /IRS990EZ/OtherAssetsTotalDetail/BOYAmt
@@ -2478,6 +2766,18 @@ class ez_part_iii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TtlPrgrmSrvcExpnssAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part III Line 32  Description: Total Program Service Expenses  most recent xpath: /IRS990EZ/TotalProgramServiceExpensesAmt
@@ -2501,6 +2801,18 @@ class ez_part_iv(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     InfInSkdOPrtIVInd = models.CharField(null=True, blank=True, max_length=1)
     # Line number: Part IV  Description: Schedule O contains a response to a question in Part IV  most recent xpath: /IRS990EZ/InfoInScheduleOPartIVInd
@@ -2518,6 +2830,18 @@ class ez_part_v(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     EZ_TrnsctnWthCntrlEntInd = models.CharField(null=True, blank=True, max_length=5)
     # Line number: Part V Line 45b  Description: Payment from or engage in transaction with a controlled entity?  most recent xpath: /IRS990EZ/TransactionWithControlEntInd
@@ -2706,6 +3030,18 @@ class ez_part_vi(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     PrtVIOfCmpOfHghstPdEmplTxt = models.TextField(null=True, blank=True)
     # Line number: Part VI Line 50  Description: If there are none, enter "None"  most recent xpath: /IRS990EZ/PartVIOfCompOfHghstPdEmplTxt
@@ -2753,6 +3089,18 @@ class EZSpclCndtnDsc(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     SpclCndtnDsc = models.TextField(null=True, blank=True)
     # Description: Special condition description  most recent xpath: /IRS990EZ/SpecialConditionDesc
@@ -2771,6 +3119,18 @@ class EZPrgrmSrvcAccmplshmnt(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     DscrptnPrgrmSrvcAccmTxt = models.TextField(null=True, blank=True)
     # Line number:  Part III  Description:  Description of program service accomplishments  most recent xpath: /IRS990EZ/ProgramSrvcAccomplishmentGrp/DescriptionProgramSrvcAccomTxt
@@ -2798,6 +3158,18 @@ class EZOffcrDrctrTrstEmpl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TtlTxt = models.CharField(null=True, blank=True, max_length=100)
     # Line number:  Part IV - Column (a)  Description:  Title  most recent xpath: /IRS990EZ/OfficerDirectorTrusteeEmplGrp/TitleTxt
@@ -2846,6 +3218,18 @@ class EZFrgnFnnclAccntCntryCd(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrgnFnnclAccntCntryCd = models.CharField(null=True, blank=True, max_length=2)
     # Line number: Part V Line 42b  Description: Name of foreign country  most recent xpath: /IRS990EZ/ForeignFinancialAccountCntryCd
@@ -2864,6 +3248,18 @@ class EZFrgnOffcCntryCd(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrgnOffcCntryCd = models.CharField(null=True, blank=True, max_length=2)
     # Line number: Part V Line 42c  Description: Name of foreign country  most recent xpath: /IRS990EZ/ForeignOfficeCountryCd
@@ -2882,6 +3278,18 @@ class EZSttsWhrCpyOfRtrnIsFldCd(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     SttsWhrCpyOfRtrnIsFldCd = models.CharField(null=True, blank=True, max_length=2)
     # Line number: Part V Line 41  Description: States With Which a Copy of This Return is Filed  most recent xpath: /IRS990EZ/StatesWhereCopyOfReturnIsFldCd
@@ -2900,6 +3308,18 @@ class EZCmpnstnHghstPdEmpl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     ExpnsAccntAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Part VI Line 50 Column (e)  Description:  Expense Account  most recent xpath: /IRS990EZ/CompensationHighestPaidEmplGrp/ExpenseAccountAmt
@@ -2933,6 +3353,18 @@ class EZCmpnstnOfHghstPdCntrct(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     CmpnstnOfHghstPdCntrct_PrsnNm = models.TextField(null=True, blank=True)
     # Line number:  Part VI Line 51 Column (a)  Description:  Highest paid contractor's name - Person  most recent xpath: /IRS990EZ/CompensationOfHghstPdCntrctGrp/PersonNm
@@ -3006,6 +3438,18 @@ class pf_part_0(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     MthdOfAccntngOthrInd = models.TextField(null=True, blank=True)
     # Line number: J  Description: Method of accounting - Other  most recent xpath: /IRS990PF/MethodOfAccountingOtherInd
@@ -3074,6 +3518,18 @@ class pf_part_i(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     ExcssRvnOvrExpnssAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part I Line 27a(a)  Description: Excess of Revenue Over Expenses and Disbursements - Revenue and Expenses per Books  most recent xpath: /IRS990PF/AnalysisOfRevenueAndExpenses/ExcessRevenueOverExpensesAmt
@@ -3361,6 +3817,18 @@ class pf_part_ii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     GrntsPyblEOYAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part II Line 18(b)  Description: Grants Payable - End of Year - Book Value  most recent xpath: /IRS990PF/Form990PFBalanceSheetsGrp/GrantsPayableEOYAmt
@@ -3681,6 +4149,18 @@ class pf_part_iii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TtNtAstOrFndBlncsEOYAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part III Line 6  Description: Total Net Assets or Fund Balances at End of Year  most recent xpath: /IRS990PF/ChgInNetAssetsFundBalancesGrp/TotNetAstOrFundBalancesEOYAmt
@@ -3713,6 +4193,18 @@ class pf_part_iv(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     NtShrtTrmCptlGnLssAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part IV Line 3  Description: Net Short-Term Capital Gain or Loss  most recent xpath: /IRS990PF/CapGainsLossTxInvstIncmDetail/NetShortTermCapitalGainLossAmt
@@ -3733,6 +4225,18 @@ class pf_part_v(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     NtVlNnchrtblAsstsYr3Amt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part V Line 1(c), row 3  Description: Noncharitable Assets - Year 3  most recent xpath: /IRS990PF/QlfyUndSect4940eReducedTaxGrp/NetVlNoncharitableAssetsYr3Amt
@@ -3830,6 +4334,18 @@ class pf_part_vi(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     OrgnlRtrnTxPdAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part VI Line 7 Tax Paid with Orig Return  Description: Tax Paid with the Original Return  most recent xpath: /IRS990PF/ExciseTaxBasedOnInvstIncmGrp/OriginalReturnTaxPaidAmt
@@ -3913,6 +4429,18 @@ class pf_part_viia(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     LctnOfBksUSAddrss_SttAbbrvtnCd = models.CharField(
         null=True, blank=True, max_length=2
@@ -4128,6 +4656,18 @@ class pf_part_viib(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     UndstrbtdIncmPY4Yr = models.IntegerField(null=True, blank=True)
     # Line number: Part VII-B Line 2a  Description: Undistributed Income Prior Year 4  most recent xpath: /IRS990PF/StatementsRegardingActy4720Grp/UndistributedIncomePY4Yr
@@ -4250,6 +4790,18 @@ class pf_part_viii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     CmpOfHghstPdCntrctOrNONETxt = models.TextField(null=True, blank=True)
     # Line number: Part VIII Line 3  Description: If there are none, enter "None"  most recent xpath: /IRS990PF/OfficerDirTrstKeyEmplInfoGrp/CompOfHghstPdCntrctOrNONETxt
@@ -4276,6 +4828,18 @@ class pf_part_ixa(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     Expnss4Amt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part IX-A Line 4  Description: Expenses 4  most recent xpath: /IRS990PF/SummaryOfDirectChrtblActyGrp/Expenses4Amt
@@ -4314,6 +4878,18 @@ class pf_part_ixb(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     Dscrptn2Txt = models.TextField(null=True, blank=True)
     # Line number: Part IX-B Line 2  Description: Description 2  most recent xpath: /IRS990PF/SumOfProgramRelatedInvstGrp/Description2Txt
@@ -4346,6 +4922,18 @@ class pf_part_x(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     AvrgMnthlyCshBlncsAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part X Line 1b  Description: Average Monthly Cash Balances  most recent xpath: /IRS990PF/MinimumInvestmentReturnGrp/AverageMonthlyCashBalancesAmt
@@ -4390,6 +4978,18 @@ class pf_part_xi(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     DstrbtblAsAdjstdAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part XI Line 7  Description: Distributable Amount as Adjusted  most recent xpath: /IRS990PF/DistributableAmountGrp/DistributableAsAdjustedAmt
@@ -4436,6 +5036,18 @@ class pf_part_xii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     PrgrmRltdInvstTtlAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part XII Line 1b  Description: Program Related Investments Total  most recent xpath: /IRS990PF/PFQualifyingDistributionsGrp/ProgramRelatedInvstTotalAmt
@@ -4492,6 +5104,18 @@ class pf_part_xiii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     UndstrbtdIncmPYAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part XIII Line 2a(c)  Description: Undistributed Income Prior Year  most recent xpath: /IRS990PF/UndistributedIncomeGrp/UndistributedIncomePYAmt
@@ -4608,6 +5232,18 @@ class pf_part_xiv(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TtlAssts_Yr2Amt = models.BigIntegerField(null=True, blank=True)
     # Line number:  column (c)  Description:  Year 2  most recent xpath: /IRS990PF/PrivateOperatingFoundationsGrp/TotalAssetsGrp/Year2Amt
@@ -4817,6 +5453,18 @@ class pf_part_xv(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TtlGrntOrCntrApprvFtAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part XV Line 3b Total  Description: Total Grant or Contribution Approved for Future Payment  most recent xpath: /IRS990PF/SupplementaryInformationGrp/TotalGrantOrContriApprvFutAmt
@@ -4840,6 +5488,18 @@ class pf_part_xvia(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     OthrInvstmntIncmPrtVII_RltdOrExmptFnctnIncmAmt = models.BigIntegerField(
         null=True, blank=True
@@ -5119,6 +5779,18 @@ class pf_part_xvii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     ShrngOfFcltsEtcInd = models.CharField(null=True, blank=True, max_length=5)
     # Line number: Part XVII Line 1c  Description: Other transactions : Sharing of facilities, equipment, mailing lists, other assets, or paid employees  most recent xpath: /IRS990PF/TrnsfrTransRlnNonchrtblEOGrp/SharingOfFacilitiesEtcInd
@@ -5164,6 +5836,18 @@ class PFSpclCndtnDsc(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     SpclCndtnDsc = models.TextField(null=True, blank=True)
     # Description: Special condition description  most recent xpath: /IRS990PF/SpecialConditionDesc
@@ -5182,6 +5866,18 @@ class PFCpGnsLssTxInvstIncm(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     HwAcqrdCd = models.TextField(null=True, blank=True)
     # Line number: Part IV Line 1(b)  Description: How Acquired  most recent xpath: /IRS990PF/CapGainsLossTxInvstIncmDetail/CapGainsLossTxInvstIncmGrp/HowAcquiredCd
@@ -5233,6 +5929,18 @@ class PFFrgnCntryCd(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrgnCntryCd = models.CharField(null=True, blank=True, max_length=2)
     # Line number: Part VII-A Line 16  Description: Name of foreign country  most recent xpath: /IRS990PF/StatementsRegardingActyGrp/ForeignCountryCd
@@ -5251,6 +5959,18 @@ class PFOrgRprtOrRgstrSttCd(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     OrgRprtOrRgstrSttCd = models.CharField(null=True, blank=True, max_length=2)
     # Line number: Part VII-A Line 8a  Description: States Filed With  most recent xpath: /IRS990PF/StatementsRegardingActyGrp/OrgReportOrRegisterStateCd
@@ -5269,6 +5989,18 @@ class PFCmpnstnHghstPdEmpl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     CmpnstnHghstPdEmpl_TtlTxt = models.CharField(null=True, blank=True, max_length=20)
     # Line number:  Part VIII Line 2(b)  Description:  Title  most recent xpath: /IRS990PF/OfficerDirTrstKeyEmplInfoGrp/CompensationHighestPaidEmplGrp/TitleTxt
@@ -5335,6 +6067,18 @@ class PFCmpnstnOfHghstPdCntrct(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrgnAddrss_PrvncOrSttNm = models.TextField(null=True, blank=True)
     # Line number:  Part VIII Line 3(a)  Description:  Province or state  most recent xpath: /IRS990PF/OfficerDirTrstKeyEmplInfoGrp/CompensationOfHghstPdCntrctGrp/ForeignAddress/ProvinceOrStateNm
@@ -5409,6 +6153,18 @@ class PFOffcrDrTrstKyEmpl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     OffcrDrTrstKyEmpl_CmpnstnAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Part VIII Line 1(c)  Description:  Compensation  most recent xpath: /IRS990PF/OfficerDirTrstKeyEmplInfoGrp/OfficerDirTrstKeyEmplGrp/CompensationAmt
@@ -5492,6 +6248,18 @@ class PFApplctnSbmssnInf(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     RcpntFrgnAddrss_PrvncOrSttNm = models.TextField(null=True, blank=True)
     # Line number: Part XV Line 2a  Description:  Province or state  most recent xpath: /IRS990PF/SupplementaryInformationGrp/ApplicationSubmissionInfoGrp/RecipientForeignAddress/ProvinceOrStateNm
@@ -5568,6 +6336,18 @@ class PFCntrbtngMngrNm(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     CntrbtngMngrNm = models.CharField(null=True, blank=True, max_length=35)
     # Line number: Part XV Line 1a  Description: Contributing Manager  most recent xpath: /IRS990PF/SupplementaryInformationGrp/ContributingManagerNm
@@ -5586,6 +6366,18 @@ class PFGrntOrCntrApprvFrFt(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     RcpntUSAddrss_AddrssLn1Txt = models.CharField(null=True, blank=True, max_length=35)
     # Line number: Part XV Line 3b  Description:  Address line 1  most recent xpath: /IRS990PF/SupplementaryInformationGrp/GrantOrContriApprvForFutGrp/RecipientUSAddress/AddressLine1Txt
@@ -5665,6 +6457,18 @@ class PFGrntOrCntrbtnPdDrYr(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     RcpntFrgnAddrss_AddrssLn1Txt = models.CharField(
         null=True, blank=True, max_length=35
@@ -5744,6 +6548,18 @@ class PFShrhldrMngrNm(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     ShrhldrMngrNm = models.CharField(null=True, blank=True, max_length=35)
     # Line number: Part XV Line 1b  Description: Shareholder Manager  most recent xpath: /IRS990PF/SupplementaryInformationGrp/ShareholderManagerNm
@@ -5762,6 +6578,18 @@ class PFOthrRvnDscrbd(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     UnrltdBsnssTxblIncmAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Part XVI-A - Column (B)  Description:  Amount  most recent xpath: /IRS990PF/AnalysisIncomeProducingActyGrp/OtherRevenueDescribedGrp/UnrelatedBusinessTaxblIncmAmt
@@ -5795,6 +6623,18 @@ class PFPrgrmSrvcRvPrtVII(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     BsnssCd = models.TextField(null=True, blank=True)
     # Line number:  Part XVI-A - Column (A)  Description:  Business code  most recent xpath: /IRS990PF/AnalysisIncomeProducingActyGrp/ProgramServiceRevenueDtl/BusinessCd
@@ -5828,6 +6668,18 @@ class PFRlnOfActyTAccmOfExmptPrps(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     LnNmbrTxt = models.TextField(null=True, blank=True)
     # Line number: Part XVI-B  Description:  Line number  most recent xpath: /IRS990PF/RlnOfActyToAccomOfExmptPrpsGrp/RlnOfActyToAccomOfExmptPrpsGrp/LineNumberTxt
@@ -5849,6 +6701,18 @@ class PFRltnshpSkdDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     OrgnztnDsc = models.CharField(null=True, blank=True, max_length=20)
     # Line number:  Part XVII Line 2b Column (b)  Description:  Type of organization  most recent xpath: /IRS990PF/TrnsfrTransRlnNonchrtblEOGrp/RelationshipScheduleDetail/OrganizationTypeDesc
@@ -5876,6 +6740,18 @@ class PFTrnsfrSkdDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     BsnssNmLn2Txt = models.CharField(null=True, blank=True, max_length=75)
     # Line number:  Part XVII Line 1d Column (c)  Description:  Business name line 2  most recent xpath: /IRS990PF/TrnsfrTransRlnNonchrtblEOGrp/TransferScheduleDetail/NoncharitableExemptOrgName/BusinessNameLine2Txt
@@ -5905,6 +6781,18 @@ class skeda_part_i(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     SchlInd = models.CharField(null=True, blank=True, max_length=1)
     # Line number: Part I Line 2  Description: A school. Section 170(b)(1)(A)(ii)  most recent xpath: /IRS990ScheduleA/SchoolInd
@@ -5982,6 +6870,18 @@ class skeda_part_ii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     UnrltdBsnssNtIncm170_TtlAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Part II and III Column (f)  Description:  Total  most recent xpath: /IRS990ScheduleA/UnrelatedBusinessNetIncm170Grp/TotalAmt
@@ -6210,6 +7110,18 @@ class skeda_part_iii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     NtIncmFrmOthrUBI_CrrntTxYrMns2YrsAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Part II and III Column (c)  Description:  Current tax year minus two years  most recent xpath: /IRS990ScheduleA/NetIncomeFromOtherUBIGrp/CurrentTaxYearMinus2YearsAmt
@@ -6605,6 +7517,18 @@ class skeda_part_iv(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TmlyPrvddDcmntsInd = models.CharField(null=True, blank=True, max_length=5)
     # Line number:  Part IV Section D Line 1  Description:  Timely provided written notice, copy of Form 990, and governing documents?  most recent xpath: /IRS990ScheduleA/Form990SchAType3SprtOrgAllGrp/TimelyProvidedDocumentsInd
@@ -6724,6 +7648,18 @@ class skeda_part_v(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     DstrbtblAmnt_FrstYr3NnFncInd = models.CharField(null=True, blank=True, max_length=1)
     # Line number:  Part V Section C Line 7  Description:  First year as a non-functionally-integrated Type III supporting organization  most recent xpath: /IRS990ScheduleA/DistributableAmountGrp/FirstYearType3NonFuncInd
@@ -6985,6 +7921,18 @@ class skeda_part_vi(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FctsAndCrcmstncsTstTxt = models.TextField(null=True, blank=True)
     # Line number: Part VI  Description: Facts and circumstances test  most recent xpath: /IRS990ScheduleA/FactsAndCircumstancesTestTxt
@@ -7003,6 +7951,18 @@ class SkdAAgrcltrlNmAndAddrss(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     CtyNm = models.CharField(null=True, blank=True, max_length=22)
     # Line number:  Part I Line 9  Description:  US city or foreign city  most recent xpath: /IRS990ScheduleA/AgriculturalNameAndAddressGrp/CityNm
@@ -7033,6 +7993,18 @@ class SkdAHsptlNmAndAddrss(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     SttAbbrvtnCd = models.CharField(null=True, blank=True, max_length=2)
     # Line number:  Part I Line 4  Description:  US address State  most recent xpath: /IRS990ScheduleA/HospitalNameAndAddressGrp/StateAbbreviationCd
@@ -7063,6 +8035,18 @@ class SkdASpprtdOrgInfrmtn(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     GvrnngDcmntLstdInd = models.CharField(null=True, blank=True, max_length=5)
     # Line number:  Part I Line 12g Column (iv)  Description:  Is the supported organization listed in your governing documents?  most recent xpath: /IRS990ScheduleA/SupportedOrgInformationGrp/GoverningDocumentListedInd
@@ -7099,6 +8083,18 @@ class SkdAFrm990SkdAPrtVI(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     ExplntnTxt = models.TextField(null=True, blank=True)
     # Line number:  Schedule A Part VI  Description:  Form, part and line number reference explanation  most recent xpath: /IRS990ScheduleA/Form990ScheduleAPartVIGrp/ExplanationTxt
@@ -7119,6 +8115,18 @@ class skedb_part_0(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     SpclRlMtOn3rdSprtTstInd = models.CharField(null=True, blank=True, max_length=1)
     # Description: For a section 501(c)(3) organization filing Form 990, or Form 990-EZ, that met the 33 1/3 % support test of the regulations under sections 509(a)(1)/170(b)(1)(A)(vi) and received from any one contributor, during the year, a contribution of the greater of $5,000 or 2% of the amount on line 1 of these forms  most recent xpath: /IRS990ScheduleB/SpclRuleMetOne3rdSuprtTestInd
@@ -7163,6 +8171,18 @@ class skedb_part_ii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TtlUndr1000CntrbtnsAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part III  Description: Total of contributions of $1,000 or less  most recent xpath: /IRS990ScheduleB/TotalUnder1000ContributionsAmt
@@ -7181,6 +8201,18 @@ class SkdBCntrbtrInfrmtn(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     CntrbtrUSAddrss_ZIPCd = models.CharField(null=True, blank=True, max_length=15)
     # Line number:  Part I Column (b)  Description:  ZIP code  most recent xpath: /IRS990ScheduleB/ContributorInformationGrp/ContributorUSAddress/ZIPCd
@@ -7282,6 +8314,18 @@ class SkdBChrtblCntrbtnsDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TrnsfrUSAddrss_SttAbbrvtnCd = models.CharField(null=True, blank=True, max_length=2)
     # Line number:  Part III Column (e)  Description:  State  most recent xpath: /IRS990ScheduleB/CharitableContributionsDetail/TransfereeUSAddress/StateAbbreviationCd
@@ -7366,6 +8410,18 @@ class SkdBNnCshPrprtyCntrbtn(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     NncshPrprtyDsc = models.CharField(null=True, blank=True, max_length=100)
     # Line number:  Part II Column (b)  Description:  Description of noncash property given  most recent xpath: /IRS990ScheduleB/NonCashPropertyContributionGrp/NoncashPropertyDesc
@@ -7392,6 +8448,18 @@ class skedc_part_0(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     Sctn4955MngrsTxAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part I-B Line 2  Description: Enter the amount of any excise tax incurred by organization managers under section 4955  most recent xpath: /IRS990ScheduleC/Section4955ManagersTaxAmt
@@ -7436,6 +8504,18 @@ class skedc_part_iia(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     LbbyngNntxblAmnt_AffltdGrpTtlAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Part II-A Column (b)  Description:  Affiliated group totals  most recent xpath: /IRS990ScheduleC/LobbyingNontaxableAmountGrp/AffiliatedGroupTotalAmt
@@ -7589,6 +8669,18 @@ class skedc_part_iib(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     DrctCntctLgsltrsAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part II-B Line 1g Column (b)  Description: Direct contact with legislators, their staffs, government officials, or a legislative body (only for section 501(c)(3))  most recent xpath: /IRS990ScheduleC/DirectContactLegislatorsAmt
@@ -7666,6 +8758,18 @@ class skedc_part_iiia(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     OnlyInHsLbbyngInd = models.CharField(null=True, blank=True, max_length=5)
     # Line number: Part III-A Line 2  Description: Did the organization make only in-house lobbying expenditures of $2,000 or less?  most recent xpath: /IRS990ScheduleC/OnlyInHouseLobbyingInd
@@ -7689,6 +8793,18 @@ class skedc_part_iiib(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     NnDdctblLbbyngPltclTtAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part III-B Line 2c  Description: Total  most recent xpath: /IRS990ScheduleC/NonDeductibleLbbyngPltclTotAmt
@@ -7725,6 +8841,18 @@ class SkdCSctn527PltclOrg(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrgnAddrss_CntryCd = models.CharField(null=True, blank=True, max_length=2)
     # Line number: Part I-C Line 5(b)  Description:  Country  most recent xpath: /IRS990ScheduleC/Section527PoliticalOrgGrp/ForeignAddress/CountryCd
@@ -7792,6 +8920,18 @@ class SkdCSpplmntlInfrmtnDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     ExplntnTxt = models.TextField(null=True, blank=True)
     # Line number: Part IV  Description:  Form, part and line number reference explanation  most recent xpath: /IRS990ScheduleC/SupplementalInformationDetail/ExplanationTxt
@@ -7812,6 +8952,18 @@ class skedd_part_i(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     DnrAdvsdFndsHldCnt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part I Line 1 Column (a)  Description: Enter the total number of donor advised funds maintained at the end of the tax year  most recent xpath: /IRS990ScheduleD/DonorAdvisedFundsHeldCnt
@@ -7856,6 +9008,18 @@ class skedd_part_ii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     SttsEsmntsHldCnt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part II Line 4  Description: Number of states in which the organization held an easement  most recent xpath: /IRS990ScheduleD/StatesEasementsHeldCnt
@@ -7919,6 +9083,18 @@ class skedd_part_iii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     CllctnUsdOthrPrpss_OthrPrpssDsc = models.CharField(
         null=True, blank=True, max_length=100
@@ -7970,6 +9146,18 @@ class skedd_part_iv(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     InclEscrwCstdlAcctLbInd = models.CharField(null=True, blank=True, max_length=5)
     # Line number: Part IV Line 2a  Description: Did the organization include an amount on Form 990, Part X, line 21?  most recent xpath: /IRS990ScheduleD/InclEscrowCustodialAcctLiabInd
@@ -8005,6 +9193,18 @@ class skedd_part_v(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     SkdD_PrmnntEndwmntBlncEOYPct = models.DecimalField(
         null=True, blank=True, max_digits=6, decimal_places=5
@@ -8164,6 +9364,18 @@ class skedd_part_vi(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     LshldImprvmnts_DprctnAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Part VI Column (c)  Description:  Depreciation  most recent xpath: /IRS990ScheduleD/LeaseholdImprovementsGrp/DepreciationAmt
@@ -8242,6 +9454,18 @@ class skedd_part_vii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     ClslyHldEqtyIntrsts_MthdVltnCd = models.TextField(null=True, blank=True)
     # Line number:  Column (c)  Description:  Method of valuation  most recent xpath: /IRS990ScheduleD/CloselyHeldEquityInterestsGrp/MethodValuationCd
@@ -8271,6 +9495,18 @@ class skedd_part_viii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TtlBkVlPrgrmRltdAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part VIII Column (b)  Description: Total of book value  most recent xpath: /IRS990ScheduleD/TotalBookValueProgramRltdAmt
@@ -8288,6 +9524,18 @@ class skedd_part_ix(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TtlBkVlOthrAsstsAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part IX Column (b)  Description: Total book value  most recent xpath: /IRS990ScheduleD/TotalBookValueOtherAssetsAmt
@@ -8305,6 +9553,18 @@ class skedd_part_x(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TtlLbltyAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part X Column (b)  Description: Total of liability amounts  most recent xpath: /IRS990ScheduleD/TotalLiabilityAmt
@@ -8328,6 +9588,18 @@ class skedd_part_xi(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     OthrRvnsNtInclddAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part XI Line 4b  Description: Other revenues not included  most recent xpath: /IRS990ScheduleD/OtherRevenuesNotIncludedAmt
@@ -8375,6 +9647,18 @@ class skedd_part_xii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     PrrYrAdjstmntsAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part XII Line 2b  Description: Prior year adjustments  most recent xpath: /IRS990ScheduleD/PriorYearAdjustmentsAmt
@@ -8423,6 +9707,18 @@ class SkdDOthrScrts(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     Dsc = models.CharField(null=True, blank=True, max_length=100)
     # Line number:  Column (a)  Description:  Description  most recent xpath: /IRS990ScheduleD/OtherSecuritiesGrp/Desc
@@ -8447,6 +9743,18 @@ class SkdDInvstPrgrmRltdOrg(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     MthdVltnCd = models.TextField(null=True, blank=True)
     # Line number:  Column (c)  Description:  Method of valuation  most recent xpath: /IRS990ScheduleD/InvstProgramRelatedOrgGrp/MethodValuationCd
@@ -8471,6 +9779,18 @@ class SkdDOthrAsstsOrg(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     Dsc = models.CharField(null=True, blank=True, max_length=100)
     # Line number:  Column (a)  Description:  Description  most recent xpath: /IRS990ScheduleD/OtherAssetsOrgGrp/Desc
@@ -8492,6 +9812,18 @@ class SkdDOthrLbltsOrg(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     Dsc = models.CharField(null=True, blank=True, max_length=100)
     # Line number:  Column (a)  Description:  Description  most recent xpath: /IRS990ScheduleD/OtherLiabilitiesOrgGrp/Desc
@@ -8513,6 +9845,18 @@ class SkdDSpplmntlInfrmtnDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     ExplntnTxt = models.TextField(null=True, blank=True)
     # Line number: Part XIII  Description:  Form part and line number reference explanation  most recent xpath: /IRS990ScheduleD/SupplementalInformationDetail/ExplanationTxt
@@ -8533,6 +9877,18 @@ class skede_part_i(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     DscrmntRcAthltPrgInd = models.CharField(null=True, blank=True, max_length=5)
     # Line number: Line 5g  Description: Does the organization discriminate by race in any way athletic programs?  most recent xpath: /IRS990ScheduleE/DiscriminateRaceAthltProgInd
@@ -8602,6 +9958,18 @@ class SkdESpplmntlInfrmtnDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrmAndLnRfrncDsc = models.CharField(null=True, blank=True, max_length=100)
     # Line number: Part II  Description:  Form, part and line number reference  most recent xpath: /IRS990ScheduleE/SupplementalInformationDetail/FormAndLineReferenceDesc
@@ -8622,6 +9990,18 @@ class skedf_part_i(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     CntnttnTtlOffcCnt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part I Line 3b Column (b)  Description: Total offices from continuation sheets to Part I  most recent xpath: /IRS990ScheduleF/ContinutationTotalOfficeCnt
@@ -8672,6 +10052,18 @@ class skedf_part_ii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     Ttl501c3OrgCnt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part II line 2  Description: Total number of 501(c)(3) organizations  most recent xpath: /IRS990ScheduleF/Total501c3OrgCnt
@@ -8692,6 +10084,18 @@ class skedf_part_iv(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrgnCrpOwnrshpInd = models.CharField(null=True, blank=True, max_length=5)
     # Line number: Part IV Line 3  Description: Did the organization have an ownership interest in a foreign corporation during the tax year?  most recent xpath: /IRS990ScheduleF/ForeignCorpOwnershipInd
@@ -8725,6 +10129,18 @@ class SkdFAccntActvtsOtsdUS(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     RgnTxt = models.CharField(null=True, blank=True, max_length=100)
     # Line number:  Part I Line 3 Column (a)  Description:  Region  most recent xpath: /IRS990ScheduleF/AccountActivitiesOutsideUSGrp/RegionTxt
@@ -8758,6 +10174,18 @@ class SkdFGrntsTOrgOtsdUS(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     PrpsOfGrntTxt = models.TextField(null=True, blank=True)
     # Line number:  Column (d)  Description:  Purpose of grant  most recent xpath: /IRS990ScheduleF/GrantsToOrgOutsideUSGrp/PurposeOfGrantTxt
@@ -8794,6 +10222,18 @@ class SkdFFrgnIndvdlsGrnts(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     VltnMthdUsdDsc = models.CharField(null=True, blank=True, max_length=100)
     # Line number:  Column (h)  Description:  Method of valuation  most recent xpath: /IRS990ScheduleF/ForeignIndividualsGrantsGrp/ValuationMethodUsedDesc
@@ -8833,6 +10273,18 @@ class SkdFSpplmntlInfrmtnDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     ExplntnTxt = models.TextField(null=True, blank=True)
     # Line number: Part V  Description:  Form, part and line number reference explanation  most recent xpath: /IRS990ScheduleF/SupplementalInformationDetail/ExplanationTxt
@@ -8853,6 +10305,18 @@ class skedg_part_i(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     SlcttnOfGvtGrntsInd = models.CharField(null=True, blank=True, max_length=1)
     # Line number: Part I Line 1  Description: Solicitation of government grants  most recent xpath: /IRS990ScheduleG/SolicitationOfGovtGrantsInd
@@ -8903,6 +10367,18 @@ class skedg_part_ii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     DrctExpnsSmmryEvntsAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Line 10 Column (d)  Description:  Direct expense summary  most recent xpath: /IRS990ScheduleG/FundraisingEventInformationGrp/DirectExpenseSummaryEventsAmt
@@ -9046,6 +10522,18 @@ class skedg_part_iii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     GmngInfrmtn_OthrDrctExpnssBngAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Line 5 Column (a)  Description:  Other direct expenses, bingo  most recent xpath: /IRS990ScheduleG/GamingInformationGrp/OtherDirectExpensesBingoAmt
@@ -9452,6 +10940,18 @@ class SkdGFndrsrActvtyInf(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FndrsrActvtyInf_RtndByCntrctrAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Part I Line 2b(v)  Description:  Amount paid to (or retained by) fundraiser listed in (i)  most recent xpath: /IRS990ScheduleG/FundraiserActivityInfoGrp/RetainedByContractorAmt
@@ -9530,6 +11030,18 @@ class SkdGLcnsdSttsCd(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     LcnsdSttsCd = models.CharField(null=True, blank=True, max_length=2)
     # Line number: Part I Line 3  Description: List all states in which the organization is registered or licensed to solicit funds or has been notified it is exempt from registration or licensing  most recent xpath: /IRS990ScheduleG/LicensedStatesCd
@@ -9548,6 +11060,18 @@ class SkdGSttsWhrGmngCndctdCd(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     SttsWhrGmngCndctdCd = models.CharField(null=True, blank=True, max_length=2)
     # Line number: Part III Line 9  Description: Enter state where organization conducts gaming activities  most recent xpath: /IRS990ScheduleG/StatesWhereGamingConductedCd
@@ -9566,6 +11090,18 @@ class SkdGSpplmntlInfrmtnDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrmAndLnRfrncDsc = models.CharField(null=True, blank=True, max_length=100)
     # Line number: Part IV  Description:  Form, part and line number reference  most recent xpath: /IRS990ScheduleG/SupplementalInformationDetail/FormAndLineReferenceDesc
@@ -9586,6 +11122,18 @@ class skedh_part_i(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TtlCmmntyBnfts_NtCmmntyBnftExpnsAmt = models.BigIntegerField(null=True, blank=True)
     # Line number:  Column (e)  Description:  Net community benefit expense  most recent xpath: /IRS990ScheduleH/TotalCommunityBenefitsGrp/NetCommunityBenefitExpnsAmt
@@ -9929,6 +11477,18 @@ class skedh_part_ii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     LdrshpDvlpmnt_TtlExpnsPct = models.DecimalField(
         null=True, blank=True, max_digits=6, decimal_places=5
@@ -10177,6 +11737,18 @@ class skedh_part_iii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     CstAccntngSystmInd = models.CharField(null=True, blank=True, max_length=1)
     # Line number: Part III Section B Line 8  Description:  Cost accounting system  most recent xpath: /IRS990ScheduleH/CostingMethodologyUsedGrp/CostAccountingSystemInd
@@ -10224,6 +11796,18 @@ class skedh_part_va(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     HsptlFcltsCnt = models.IntegerField(null=True, blank=True)
     # Line number: Part V Section A  Description: How many hospital facilities did the organization operate during the tax year?  most recent xpath: /IRS990ScheduleH/HospitalFacilitiesCnt
@@ -10241,6 +11825,18 @@ class skedh_part_vd(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FcltyNm = models.IntegerField(null=True, blank=True)
     # Line number: Part V Section D  Description: Number of other facilities  most recent xpath: /IRS990ScheduleH/FacilityNum
@@ -10259,6 +11855,18 @@ class SkdHMngmntCAndJntVntrs(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     BsnssNmLn1Txt = models.CharField(null=True, blank=True, max_length=75)
     # Line number: Part IV Column (a)  Description:  Business name line 1  most recent xpath: /IRS990ScheduleH/ManagementCoAndJntVenturesGrp/EntityName/BusinessNameLine1Txt
@@ -10298,6 +11906,18 @@ class SkdHHsptlFclts(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     HsptlFclts_WbstAddrssTxt = models.CharField(null=True, blank=True, max_length=100)
     # Line number: Part V Section A  Description:  Primary website address of the hospital facility  most recent xpath: /IRS990ScheduleH/HospitalFacilitiesGrp/WebsiteAddressTxt
@@ -10386,6 +12006,18 @@ class SkdHHsptlFcltyPlcsPrctc(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FAPAvlblOnWbstInd = models.CharField(null=True, blank=True, max_length=1)
     # Line number: Part V Section B Line 16a  Description:  FAP widely available on a website  most recent xpath: /IRS990ScheduleH/HospitalFcltyPoliciesPrctcGrp/FAPAvailableOnWebsiteInd
@@ -10696,6 +12328,18 @@ class SkdHSpplmntlInfrmtn(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrmAndLnRfrncDsc = models.CharField(null=True, blank=True, max_length=100)
     # Line number: Part V  Description:  Form, part and line number reference  most recent xpath: /IRS990ScheduleH/SupplementalInformationGrp/FormAndLineReferenceDesc
@@ -10717,6 +12361,18 @@ class SkdHOthHlthCrFclts(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     BsnssNmLn2Txt = models.CharField(null=True, blank=True, max_length=75)
     # Line number: Part V Section D  Description:  Business name line 2  most recent xpath: /IRS990ScheduleH/OthHlthCareFcltsNotHospitalGrp/OthHlthCareFcltsGrp/BusinessName/BusinessNameLine2Txt
@@ -10756,6 +12412,18 @@ class SkdHSpplmntlInfrmtnDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrmAndLnRfrncDsc = models.CharField(null=True, blank=True, max_length=100)
     # Line number: Part VI  Description:  Form, part and line number reference  most recent xpath: /IRS990ScheduleH/SupplementalInformationDetail/FormAndLineReferenceDesc
@@ -10776,6 +12444,18 @@ class skedi_part_i(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     GrntRcrdsMntndInd = models.CharField(null=True, blank=True, max_length=5)
     # Line number: Part I Line 1  Description: Does the organization maintain records to substantiate the amount of the grants or assistance, the grantees' eligibility for the grants or assistance, and the selection criteria used to award the grants or assistance?  most recent xpath: /IRS990ScheduleI/GrantRecordsMaintainedInd
@@ -10793,6 +12473,18 @@ class skedi_part_ii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TtlOthrOrgCnt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part II Line 3  Description: Enter total number of other organizations  most recent xpath: /IRS990ScheduleI/TotalOtherOrgCnt
@@ -10814,6 +12506,18 @@ class SkdIGrntsOthrAsstTIndvInUS(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     CshGrntAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part III Column (c)  Description:  Amount of cash grant  most recent xpath: /IRS990ScheduleI/GrantsOtherAsstToIndivInUSGrp/CashGrantAmt
@@ -10847,6 +12551,18 @@ class SkdISpplmntlInfrmtnDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrmAndLnRfrncDsc = models.CharField(null=True, blank=True, max_length=100)
     # Line number: Part IV  Description:  Form, part and line number reference  most recent xpath: /IRS990ScheduleI/SupplementalInformationDetail/FormAndLineReferenceDesc
@@ -10868,6 +12584,18 @@ class SkdIRcpntTbl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     RcpntTbl_IRCSctnDsc = models.CharField(null=True, blank=True, max_length=20)
     # Line number:  Part II Line  1 Column (c)  Description:  IRC code section if applicable  most recent xpath: /IRS990ScheduleI/RecipientTable/IRCSectionDesc
@@ -10942,6 +12670,18 @@ class skedj_part_i(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     CmpBsdOnRvnOfFlngOrgInd = models.CharField(null=True, blank=True, max_length=5)
     # Line number: Part I Line 5a  Description: Compensation based on revenue of filing org?  most recent xpath: /IRS990ScheduleJ/CompBasedOnRevenueOfFlngOrgInd
@@ -11035,6 +12775,18 @@ class SkdJRltdOrgOffcrTrstKyEmpl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     OthrCmpnstnFlngOrgAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part II Column (B)(iii)  Description:  Other compensation ($) from filing organization  most recent xpath: /IRS990ScheduleJ/RltdOrgOfficerTrstKeyEmplGrp/OtherCompensationFilingOrgAmt
@@ -11104,6 +12856,18 @@ class SkdJSpplmntlInfrmtnDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrmAndLnRfrncDsc = models.CharField(null=True, blank=True, max_length=100)
     # Line number: Part III  Description:  Form, Part and line number reference  most recent xpath: /IRS990ScheduleJ/SupplementalInformationDetail/FormAndLineReferenceDesc
@@ -11125,6 +12889,18 @@ class SkdKTxExmptBndsIsss(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
     documentId = models.TextField(
         blank=True, null=True, help_text="documentID attribute"
     )
@@ -11175,6 +12951,18 @@ class SkdKTxExmptBndsPrcds(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
     documentId = models.TextField(
         blank=True, null=True, help_text="documentID attribute"
     )
@@ -11252,6 +13040,18 @@ class SkdKTxExmptBndsPrvtBsUs(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
     documentId = models.TextField(
         blank=True, null=True, help_text="documentID attribute"
     )
@@ -11322,6 +13122,18 @@ class SkdKTxExmptBndsArbtrg(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
     documentId = models.TextField(
         blank=True, null=True, help_text="documentID attribute"
     )
@@ -11422,6 +13234,18 @@ class SkdKPrcdrsCrrctvActn(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
     documentId = models.TextField(
         blank=True, null=True, help_text="documentID attribute"
     )
@@ -11445,6 +13269,18 @@ class SkdKSpplmntlInfrmtnDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
     documentId = models.TextField(
         blank=True, null=True, help_text="documentID attribute"
     )
@@ -11467,6 +13303,18 @@ class skedl_part_i(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TxImpsdAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part I Line 2  Description: Amount of tax imposed  most recent xpath: /IRS990ScheduleL/TaxImposedAmt
@@ -11487,6 +13335,18 @@ class skedl_part_ii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     TtlBlncDAmt = models.BigIntegerField(null=True, blank=True)
     # Line number: Part II Column d  Description: Total balance due  most recent xpath: /IRS990ScheduleL/TotalBalanceDueAmt
@@ -11505,6 +13365,18 @@ class SkdLDsqlfdPrsnExBnftTr(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     RlnDsqlfdPrsnOrgTxt = models.CharField(null=True, blank=True, max_length=100)
     # Line number:  Part I Column (1b)  Description:  Relationship between disqualified person and organization  most recent xpath: /IRS990ScheduleL/DisqualifiedPersonExBnftTrGrp/RlnDisqualifiedPersonOrgTxt
@@ -11538,6 +13410,18 @@ class SkdLLnsBtwnOrgIntrstdPrsn(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     LnFrmOrgnztnInd = models.CharField(null=True, blank=True, max_length=1)
     # Line number:  Part II Column (d)  Description:  Loan from organization?  most recent xpath: /IRS990ScheduleL/LoansBtwnOrgInterestedPrsnGrp/LoanFromOrganizationInd
@@ -11589,6 +13473,18 @@ class SkdLGrntAsstBnftIntrstdPrsn(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     RltnshpWthOrgTxt = models.CharField(null=True, blank=True, max_length=100)
     # Line number: Part III Column (b)  Description:  Relationship with organization  most recent xpath: /IRS990ScheduleL/GrntAsstBnftInterestedPrsnGrp/RelationshipWithOrgTxt
@@ -11625,6 +13521,18 @@ class SkdLBsTrInvlvIntrstdPrsn(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     BsnssNmLn1Txt = models.CharField(null=True, blank=True, max_length=75)
     # Line number: Part IV Column (a)  Description:  Business name line 1  most recent xpath: /IRS990ScheduleL/BusTrInvolveInterestedPrsnGrp/NameOfInterested/BusinessName/BusinessNameLine1Txt
@@ -11661,6 +13569,18 @@ class SkdLSpplmntlInfrmtnDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrmAndLnRfrncDsc = models.CharField(null=True, blank=True, max_length=100)
     # Line number: Part V  Description:  Form, part and line number reference  most recent xpath: /IRS990ScheduleL/SupplementalInformationDetail/FormAndLineReferenceDesc
@@ -11681,6 +13601,18 @@ class skedm_part_i(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     ScrtsMsc_NnCshChckbxInd = models.CharField(null=True, blank=True, max_length=1)
     # Line number:  Column (a)  Description:  Checkbox for lines on Part I  most recent xpath: /IRS990ScheduleM/SecuritiesMiscellaneousGrp/NonCashCheckboxInd
@@ -12094,6 +14026,18 @@ class SkdMOthrNnCshCntrTbl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     Dsc = models.CharField(null=True, blank=True, max_length=100)
     # Line number:  Lines 25 - 28  Description:  Description  most recent xpath: /IRS990ScheduleM/OtherNonCashContriTableGrp/Desc
@@ -12124,6 +14068,18 @@ class SkdMSpplmntlInfrmtnDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrmAndLnRfrncDsc = models.CharField(null=True, blank=True, max_length=100)
     # Line number:  Part II  Description:  Form, part and line number reference  most recent xpath: /IRS990ScheduleM/SupplementalInformationDetail/FormAndLineReferenceDesc
@@ -12144,6 +14100,18 @@ class skedn_part_i(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     EmplyOfSccssrInd = models.CharField(null=True, blank=True, max_length=5)
     # Line number: Part I Line 2b  Description: Become an employee of, or independent contractor for, a successor or transferee organization?  most recent xpath: /IRS990ScheduleN/EmployeeOfSuccessorInd
@@ -12188,6 +14156,18 @@ class skedn_part_ii(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     EmplyOfSccssr2Ind = models.CharField(null=True, blank=True, max_length=5)
     # Line number: Part II Line 2b  Description: Become an employee of, or independent contractor for, a successor or transferee organization?  most recent xpath: /IRS990ScheduleN/EmployeeOfSuccessor2Ind
@@ -12215,6 +14195,18 @@ class SkdNLqdtnOfAsstsDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     LqdtnOfAsstsDtl_MthdOfFMVDtrmntnTxt = models.TextField(null=True, blank=True)
     # Line number:  Column (d)  Description:  Method of determining FMV for asset(s) distributed or transactional expenses  most recent xpath: /IRS990ScheduleN/LiquidationOfAssetsTableGrp/LiquidationOfAssetsDetail/MethodOfFMVDeterminationTxt
@@ -12290,6 +14282,18 @@ class SkdNDspstnOfAsstsDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrgnAddrss_AddrssLn1Txt = models.CharField(null=True, blank=True, max_length=35)
     # Line number:  Column (f)  Description:  Address line 1  most recent xpath: /IRS990ScheduleN/DispositionOfAssetsDetail/ForeignAddress/AddressLine1Txt
@@ -12367,6 +14371,18 @@ class SkdNSpplmntlInfrmtnDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     ExplntnTxt = models.TextField(null=True, blank=True)
     # Line number: Part III  Description:  Form, part and line number reference explanation  most recent xpath: /IRS990ScheduleN/SupplementalInformationDetail/ExplanationTxt
@@ -12388,6 +14404,18 @@ class SkdOSpplmntlInfrmtnDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     FrmAndLnRfrncDsc = models.CharField(null=True, blank=True, max_length=100)
     # Description: Form, part and line number reference  most recent xpath: /IRS990ScheduleO/SupplementalInformationDetail/FormAndLineReferenceDesc
@@ -12408,6 +14436,18 @@ class skedr_part_v(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     AsstPrchsFrmOthrOrgInd = models.CharField(null=True, blank=True, max_length=5)
     # Line number: Part V Line 1h  Description: Purchase of assets from other organization?  most recent xpath: /IRS990ScheduleR/AssetPurchaseFromOtherOrgInd
@@ -12480,6 +14520,18 @@ class SkdRIdDsrgrddEntts(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     DsrgrddEnttyNm_BsnssNmLn1Txt = models.CharField(
         null=True, blank=True, max_length=75
@@ -12573,6 +14625,18 @@ class SkdRIdRltdTxExmptOrg(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     USAddrss_ZIPCd = models.CharField(null=True, blank=True, max_length=15)
     # Line number: Part II Column (a)  Description:  ZIP code  most recent xpath: /IRS990ScheduleR/IdRelatedTaxExemptOrgGrp/USAddress/ZIPCd
@@ -12677,6 +14741,18 @@ class SkdRIdRltdOrgTxblPrtnrshp(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     IdRltdOrgTxblPrtnrshp_PrdmnntIncmTxt = models.CharField(
         null=True, blank=True, max_length=20
@@ -12795,6 +14871,18 @@ class SkdRIdRltdOrgTxblCrpTr(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     IdRltdOrgTxblCrpTr_OwnrshpPct = models.DecimalField(
         null=True, blank=True, max_digits=6, decimal_places=5
@@ -12899,6 +14987,18 @@ class SkdRTrnsctnsRltdOrg(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     BsnssNmLn1Txt = models.CharField(null=True, blank=True, max_length=75)
     # Line number:  Part V Line 2 Column (a)  Description:  Business name line 1  most recent xpath: /IRS990ScheduleR/TransactionsRelatedOrgGrp/OtherOrganizationName/BusinessNameLine1Txt
@@ -12929,6 +15029,18 @@ class SkdRUnrltdOrgTxblPrtnrshp(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     UnrltdOrgTxblPrtnrshp_EIN = models.CharField(null=True, blank=True, max_length=9)
     # Line number: Part VI Column (a)  Description:  EIN  most recent xpath: /IRS990ScheduleR/UnrelatedOrgTxblPartnershipGrp/EIN
@@ -13037,6 +15149,18 @@ class SkdRSpplmntlInfrmtnDtl(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     ExplntnTxt = models.TextField(null=True, blank=True)
     # Line number: Part VII  Description:  Form, part and line number reference explanation  most recent xpath: /IRS990ScheduleR/SupplementalInformationDetail/ExplanationTxt
@@ -13057,6 +15181,18 @@ class returnheader990x_part_i(models.Model):
         max_length=31, blank=True, null=True, help_text="unique xml return id"
     )
     ein = models.CharField(max_length=15, blank=True, null=True, help_text="filer EIN")
+    submission_year = models.IntegerField(blank=True, null=True, help_text="index year")
+    filing = models.ForeignKey(
+        "filing.Filing",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        db_index=False,
+        blank=True,
+        null=True,
+        related_name="+",
+        help_text="filing the row is from",
+    )
+    tax_year = models.IntegerField(blank=True, null=True, help_text="tax year")
 
     PrprrPrsn_EmlAddrssTxt = models.CharField(null=True, blank=True, max_length=75)
     # Description:  Email address  most recent xpath: /ReturnHeader/PreparerPersonGrp/EmailAddressTxt
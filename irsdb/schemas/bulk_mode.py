@@ -0,0 +1,124 @@
+"""
+Setup and cleanup for load_filings --bulk-mode, on postgres.
+
+Before the load, the return tables' secondary indexes are dropped, and
+optionally the tables being loaded are made UNLOGGED. Each dropped index
+is recorded in DroppedIndex in the same transaction that drops it, so if
+the load dies they're still known. load_filings puts them back when the
+load ends, whether it finished or not; if load_filings itself is killed,
+restore_bulk_mode does, as does the end of the next bulk load. Unlogged
+tables are found from the catalog.
+"""
+
+import re
+import time
+
+from django.db import connection, transaction
+
+from irsdb.filing.models import DroppedIndex
+from irsdb.schemas.index_builder import WORKERS, build_indexes
+from irsdb.schemas.partitions import (
+    get_partition_name,
+    get_partitioned_tables,
+    get_return_tables,
+)
+
+# indexes that don't back a primary key or other constraint
+SECONDARY_INDEXES_QUERY = """
+select i.indexname, i.indexdef from pg_indexes i
+where i.schemaname = 'public' and i.tablename = %s
+and not exists (
+    select 1 from pg_constraint c
+    where c.conname = i.indexname and c.conrelid = %s::regclass
+)
+"""
+# pg_indexes has ON ONLY for a partitioned table's index. Built that way
+# it covers none of the partitions and stays invalid, so it's built without
+ON_ONLY_RE = re.compile(r" ON ONLY ", re.IGNORECASE)
+
+UNLOGGED_TABLES_QUERY = """
+select relname from pg_class
+where relpersistence = 'u' and relkind = 'r' and relname like 'return%'
+and relnamespace = 'public'::regnamespace
+"""
+
+
+def get_full_definition(definition):
+    """An index's definition, building it on every partition too"""
+    return ON_ONLY_RE.sub(" ON ", definition, count=1)
+
+
+def get_load_tables(cursor, year):
+    """
+    The tables a year is loaded into: the year's partition of partitioned
+    tables, which can't be made unlogged themselves, or the table.
+    """
+    partitioned = get_partitioned_tables(cursor)
+    return [
+        get_partition_name(table, year) if table in partitioned else table
+        for table in get_return_tables(cursor)
+    ]
+
+
+def enter_bulk_mode(year, unlogged=False):
+    """Drop the return tables' secondary indexes, and make them unlogged"""
+    if connection.vendor != "postgresql":
+        raise RuntimeError("--bulk-mode needs postgres")
+
+    dropped = 0
+    start = time.time()
+    with connection.cursor() as cursor:
+        for table in get_return_tables(cursor):
+            cursor.execute(SECONDARY_INDEXES_QUERY, [table, table])
+            for name, definition in cursor.fetchall():
+                with transaction.atomic():
+                    DroppedIndex.objects.create(
+                        table_name=table,
+                        index_name=name,
+                        definition=get_full_definition(definition),
+                    )
+                    cursor.execute("drop index %s" % connection.ops.quote_name(name))
+                dropped += 1
+        print("Dropped %s indexes in %.1fs" % (dropped, time.time() - start))
+
+        if unlogged:
+            start = time.time()
+            tables = get_load_tables(cursor, year)
+            for table in tables:
+                cursor.execute("alter table %s set unlogged" % table)
+            print(
+                "Made %s tables unlogged in %.1fs" % (len(tables), time.time() - start)
+            )
+
+
+def leave_bulk_mode(workers=WORKERS):
+    """
+    Undo enter_bulk_mode: make the tables logged again, build the dropped
+    indexes back and analyze the tables. Safe to run more than once.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(UNLOGGED_TABLES_QUERY)
+        unlogged = [row[0] for row in cursor.fetchall()]
+        start = time.time()
+        for table in unlogged:
+            cursor.execute("alter table %s set logged" % table)
+        if unlogged:
+            print(
+                "Made %s tables logged in %.1fs" % (len(unlogged), time.time() - start)
+            )
+        partitioned = get_partitioned_tables(cursor)
+
+    dropped = list(DroppedIndex.objects.order_by("id"))
+    indexes = [
+        (d.index_name, d.table_name, get_full_definition(d.definition)) for d in dropped
+    ]
+    build_indexes(indexes, workers=workers, partitioned=partitioned)
+    # only forget them once they're back
+    DroppedIndex.objects.filter(id__in=[d.id for d in dropped]).delete()
+
+    start = time.time()
+    with connection.cursor() as cursor:
+        tables = get_return_tables(cursor)
+        for table in tables:
+            cursor.execute("analyze %s" % table)
+    print("Analyzed %s tables in %.1fs" % (len(tables), time.time() - start))
@@ -0,0 +1,400 @@
+import os
+import socket
+import traceback
+from datetime import datetime
+
+from django.apps import apps
+from django.db import DatabaseError, connection, connections, transaction
+from django.db.models import F
+from irsx.filing import FileMissingException, InvalidXMLException
+
+from irsdb.filing.models import UNPARSED, Filing, LoadBatch, LoadRun
+from irsdb.filing.xml_store import read_filing
+from irsdb.schemas.filing_parser import FilingXMLRunner
+from irsdb.schemas.model_accumulator import Accumulator
+from irsdb.schemas.model_writers import get_writer
+from irsdb.schemas.result_cache import ResultCache
+from irsdb.schemas.row_adapters import get_registry
+from irsdb.schemas.xml_prefetcher import XMLPrefetcher
+
+# How many filings a loader claims at once. The accumulator has its
+# own batch size for how many rows are written at a time.
+CLAIM_SIZE = 100
+
+# What the loader records on each filing, saved once per batch
+STATUS_FIELDS = [
+    "schema_version",
+    "tax_year",
+    "key_error_count",
+    "error_details",
+    "is_error",
+    "process_time",
+    "parse_complete",
+]
+
+
+class FilingLoader(object):
+    """
+    Claims unparsed filings for a year, parses them and writes the results.
+    Each loader owns its own XMLRunner and Accumulator, so several can run
+    side by side in separate processes.
+
+    With atomic set, each batch's rows are written in the same transaction
+    that marks its filings complete, and a filing that fails is skipped
+    without losing the rest of the batch.
+
+    max_buffered_rows caps the rows held in memory across all the return
+    tables. When it's reached the largest buffers are written first, or,
+    in atomic mode, everything parsed so far is written inside the batch's
+    transaction before parsing carries on.
+
+    With prefetch set, the loader claims one batch ahead and downloads its
+    missing files over that many connections while the current batch is
+    parsed.
+
+    With result_cache set to a directory, what irsx makes of each filing is
+    kept there, up to result_cache_bytes, and reused the next time that
+    filing is loaded instead of parsing its xml again.
+
+    With bulk_mode set, commits don't wait for the write ahead log to be
+    flushed on postgres.
+    """
+
+    def __init__(
+        self,
+        year,
+        eins=None,
+        claim_size=CLAIM_SIZE,
+        writer=None,
+        run_id=None,
+        atomic=False,
+        max_buffered_rows=None,
+        prefetch=0,
+        result_cache=None,
+        result_cache_bytes=None,
+        bulk_mode=False,
+    ):
+        self.year = year
+        self.run_id = run_id
+        self.atomic = atomic
+        self.eins = eins
+        self.claim_size = claim_size
+        self.worker_id = "%s:%s" % (socket.gethostname(), os.getpid())
+        # get an XMLRunner -- this is what actually does the parsing
+        self.xml_runner = FilingXMLRunner()
+        # in atomic mode rows are only written once the batch is parsed
+        self.accumulator = Accumulator(
+            writer=get_writer(writer),
+            flush_when_full=not atomic,
+            max_buffered_rows=max_buffered_rows,
+        )
+        self.prefetcher = None
+        if prefetch:
+            self.prefetcher = XMLPrefetcher(connections=prefetch)
+        self.result_cache = None
+        if result_cache:
+            self.result_cache = ResultCache(result_cache, result_cache_bytes)
+        self.bulk_mode = bulk_mode
+        self.process_count = 0
+        self.missing_filings = 0
+        # filings in the current batch whose rows were thrown away
+        self.failed_ids = set()
+
+    def process_sked(self, sked, filing_values=None):
+        """Enter just one schedule. filing_values are stored on every row"""
+        print("Processing schedule %s" % sked["schedule_name"])
+        for part in sked["schedule_parts"].keys():
+            partname = part
+            partdata = sked["schedule_parts"][part]
+            print("part %s %s" % (partname, partdata))
+
+            self.accumulator.add_model(partname, partdata, filing_values)
+
+        for groupname in sked["groups"].keys():
+            for groupdata in sked["groups"][groupname]:
+                # print("group %s %s" % (groupname, groupdata) )
+                self.accumulator.add_model(groupname, groupdata, filing_values)
+
+    def parse(self, filing):
+        """
+        Returns irsx's (result, keyerrors, schema_version) for a filing, from
+        the result cache if it's there, or None if irsx can't parse it.
+        """
+        object_id = filing.object_id
+        if self.result_cache:
+            cached = self.result_cache.get(object_id)
+            if cached:
+                return cached
+
+        try:
+            xml = read_filing(object_id, filing.submission_year)
+        except FileNotFoundError as e:
+            raise FileMissingException("%s is missing" % e)
+        try:
+            parsed_filing = self.xml_runner.run_filing_xml(object_id, xml)
+        except InvalidXMLException:
+            return None
+        if not parsed_filing:
+            return None
+
+        # schedule_list = parsed_filing.list_schedules()
+        # print("sked list is %s" % schedule_list)
+
+        parsed = (
+            parsed_filing.get_result(),
+            parsed_filing.get_keyerrors(),
+            parsed_filing.get_version(),
+        )
+        if self.result_cache:
+            self.result_cache.put(object_id, *parsed)
+        return parsed
+
+    def run_filing(self, filing):
+        object_id = filing.object_id
+
+        parsed = self.parse(filing)
+        if not parsed:
+            print(
+                "Skipping filing %s(filings with pre-2013 filings are skipped)\n row details:"
+                % (filing,)
+            )
+            return None
+
+        result, keyerrors, schema_version = parsed
+        # saved with the rest of the batch in complete_batch
+        filing.schema_version = schema_version
+        filing.tax_year = filing.get_tax_year()
+
+        if keyerrors:
+            # If we find keyerrors--xpaths that are missing from our spec, note it
+            print("Key error %s")
+            has_keyerrors = len(keyerrors) > 0
+            print("keyerror: %s" % keyerrors)
+            filing.error_details = str(keyerrors)
+            filing.key_error_count = len(keyerrors)
+            filing.is_error = has_keyerrors
+
+        if result:
+            # denormalized onto the return rows, so they can be scanned by
+            # year or joined to their filing without going through object_id.
+            # submission_year is also the partition key.
+            filing_values = {
+                "filing_id": filing.id,
+                "submission_year": filing.submission_year,
+                "tax_year": filing.tax_year,
+            }
+            for sked in result:
+                print(sked)
+                self.process_sked(sked, filing_values)
+        else:
+            print("Filing not parsed %s " % object_id)
+
+    def claim_batch(self):
+        return Filing.objects.claim_batch(
+            self.year, self.claim_size, self.worker_id, eins=self.eins
+        )
+
+    def complete_batch(self, filings):
+        """Save each filing's status, mark them complete and checkpoint the run"""
+        filing_ids = [f.id for f in filings]
+        process_time = datetime.now()
+        for filing in filings:
+            filing.process_time = process_time
+            # a filing whose rows weren't kept is left for --resume to retry
+            filing.parse_complete = filing.id not in self.failed_ids
+        self.failed_ids.clear()
+        with transaction.atomic():
+            Filing.objects.bulk_update(filings, STATUS_FIELDS)
+            if self.run_id:
+                LoadBatch.objects.create(
+                    run_id=self.run_id,
+                    worker=self.worker_id,
+                    filing_count=len(filing_ids),
+                    first_filing_id=min(filing_ids),
+                    last_filing_id=max(filing_ids),
+                )
+                LoadRun.objects.filter(id=self.run_id).update(
+                    batch_count=F("batch_count") + 1,
+                    filing_count=F("filing_count") + len(filing_ids),
+                )
+
+    def skip_filing(self, filing, error):
+        """
+        Note why a filing's rows weren't stored, and drop what parsing it
+        set, so it isn't recorded as loaded.
+        """
+        print("Skipping filing %s: %s" % (filing.object_id, error))
+        filing.schema_version = None
+        filing.key_error_count = None
+        filing.is_error = True
+        filing.error_details = str(error)
+        self.failed_ids.add(filing.id)
+
+    def run_batch(self, filings):
+        """Parse a batch. Returns the filings whose rows haven't been written."""
+        unwritten = []
+        for filing in filings:
+            print("Handling id %s" % filing.object_id)
+            try:
+                if self.atomic:
+                    self.run_filing_atomic(filing)
+                else:
+                    self.run_filing(filing)
+            except FileMissingException:
+                print("File missing %s, skipping" % filing.object_id)
+                self.missing_filings += 1
+            self.process_count += 1
+            if self.process_count % 1000 == 0:
+                print("Handled %s filings" % self.process_count)
+
+            unwritten.append(filing)
+            if self.atomic and self.accumulator.is_full():
+                # still inside the batch's transaction, so nothing is
+                # committed until the whole batch is
+                self.write_batch(unwritten)
+                unwritten = []
+        return unwritten
+
+    def run_filing_atomic(self, filing):
+        try:
+            with transaction.atomic():
+                self.run_filing(filing)
+        except FileMissingException:
+            raise
+        except Exception as e:
+            traceback.print_exc()
+            self.accumulator.discard(filing.object_id)
+            self.skip_filing(filing, e)
+
+    def write_batch(self, filings):
+        """
+        Write the whole batch in one go. If the database rejects it, write
+        it again one filing at a time and skip the filings that fail.
+        """
+        rows_by_model = self.accumulator.take_rows()
+        try:
+            with transaction.atomic():
+                self.accumulator.write_rows(rows_by_model)
+            return
+        except DatabaseError as e:
+            print("Batch failed, writing filings one at a time: %s" % e)
+
+        rows_by_filing = self.accumulator.split_by_filing(rows_by_model)
+
+        for filing in filings:
+            try:
+                with transaction.atomic():
+                    self.accumulator.write_rows(
+                        rows_by_filing.get(filing.object_id, {})
+                    )
+            except DatabaseError as e:
+                self.skip_filing(filing, e)
+
+    def needs_xml(self, filings):
+        """The filings that will be parsed, rather than read from the cache"""
+        if not self.result_cache:
+            return filings
+        return [f for f in filings if not self.result_cache.has(f.object_id)]
+
+    def batches(self):
+        """
+        Claim batches until there are none left. With a prefetcher, the next
+        batch is claimed and its files start downloading before this one
+        is handed over.
+        """
+        if not self.prefetcher:
+            filings = self.claim_batch()
+            while filings:
+                yield filings
+                filings = self.claim_batch()
+            return
+
+        filings = self.claim_batch()
+        downloads = self.prefetcher.prefetch(self.needs_xml(filings))
+        while filings:
+            next_filings = self.claim_batch()
+            next_downloads = self.prefetcher.prefetch(self.needs_xml(next_filings))
+            self.prefetcher.wait(downloads)
+            yield filings
+            filings, downloads = next_filings, next_downloads
+        print(
+            "Prefetched %s files, %s failed"
+            % (self.prefetcher.downloaded, self.prefetcher.failed)
+        )
+        self.prefetcher.close()
+
+    def run(self):
+        if self.bulk_mode and connection.vendor == "postgresql":
+            # a crash can lose the last few commits, but never part of
+            # one, so the load can still be resumed
+            with connection.cursor() as cursor:
+                cursor.execute("set synchronous_commit = off")
+
+        for filings in self.batches():
+            if self.atomic:
+                with transaction.atomic():
+                    unwritten = self.run_batch(filings)
+                    self.write_batch(unwritten)
+                    self.complete_batch(filings)
+            else:
+                self.run_batch(filings)
+                # commit anything that's left
+                self.accumulator.commit_all()
+                self.complete_batch(filings)
+            print("Processed a total of %s filings" % self.process_count)
+            print("Total missing files: %s" % self.missing_filings)
+
+        print("Done")
+        self.accumulator.redaction_report()
+        if self.result_cache:
+            print(
+                "Result cache: %s hits, %s misses"
+                % (self.result_cache.hits, self.result_cache.misses)
+            )
+
+
+def init_worker():
+    """Runs once in each worker process, before any filings are loaded."""
+    if not apps.ready:
+        import django
+
+        django.setup()
+    # build the model registry now, rather than on the first row
+    get_registry()
+    # don't reuse a connection inherited from the parent process
+    connections.close_all()
+
+
+def release_unfinished(year, eins=None, remove_rows=True, crashed_only=False):
+    """
+    Filings that were claimed but never completed may have some of their
+    rows written. Remove those rows and put the filings back in the queue.
+    Atomic loads never leave rows behind, so they can skip the removal.
+
+    With crashed_only, filings whose batch was completed but which failed
+    are left alone; only the ones a loader died holding are released.
+    """
+    unfinished = Filing.objects.for_load(year, eins).filter(
+        UNPARSED, parse_started=True
+    )
+    if crashed_only:
+        # complete_batch sets process_time on every filing in the batch
+        unfinished = unfinished.filter(process_time__isnull=True)
+    object_ids = list(unfinished.values_list("object_id", flat=True))
+    if not object_ids:
+        return 0
+
+    if remove_rows:
+        print("Removing rows from %s unfinished filings" % len(object_ids))
+        for model in apps.get_app_config("return").get_models():
+            model.objects.filter(object_id__in=object_ids).delete()
+    unfinished.update(parse_started=False)
+    return len(object_ids)
+
+
+def run_worker(year, **loader_options):
+    """Load filings in a worker process until there are none left to claim."""
+    loader = FilingLoader(year, **loader_options)
+    loader.run()
+    connections.close_all()
+    return loader.process_count, loader.missing_filings
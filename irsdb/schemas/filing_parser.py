@@ -0,0 +1,61 @@
+"""
+Parses filings with irsx straight from their xml in memory. irsx's own
+Filing only reads plain files from disk, which meant unpacking compressed
+and archived filings to a temporary file first.
+"""
+
+from xml.parsers.expat import ExpatError
+
+import xmltodict
+from irsx.filing import Filing, InvalidXMLException
+from irsx.settings import version_is_supported
+from irsx.xmlrunner import XMLRunner
+
+
+class XMLFiling(Filing):
+    """An irsx Filing for xml that's already been read, as bytes or a memoryview"""
+
+    def __init__(self, object_id, xml):
+        super().__init__(object_id)
+        self.xml = xml
+
+    def _download(self, force_overwrite=False, verbose=False):
+        # nothing to fetch, the xml is already here
+        pass
+
+    def _set_dict_from_xml(self):
+        # expat skips the byte order mark irsx opens files with utf-8-sig for
+        try:
+            self.raw_irs_dict = self._denamespacify(xmltodict.parse(self.xml))
+        except ExpatError:
+            raise InvalidXMLException(
+                "XML Parse error in %s, file may be damaged or incomplete"
+                % self.object_id
+            )
+        if "Return" not in self.raw_irs_dict:
+            raise InvalidXMLException(
+                "'Return' element not located in %s, file may be damaged or "
+                "incomplete" % self.object_id
+            )
+
+
+class FilingXMLRunner(XMLRunner):
+    """An XMLRunner that runs filings from xml in memory"""
+
+    def run_filing_xml(self, object_id, xml):
+        """Like XMLRunner.run_filing, for a filing's xml instead of its path"""
+        self.whole_filing_data = []
+        self.filing_keyerr_data = []
+        this_filing = XMLFiling(object_id, xml)
+        this_filing.process()
+        this_version = this_filing.get_version()
+        if not version_is_supported(this_version):
+            print("Filing version %s isn't supported (requires >= 2013)" % this_version)
+            return this_filing
+
+        ein = this_filing.get_ein()
+        for sked in this_filing.list_schedules():
+            self._run_schedule(sked, object_id, this_filing.get_schedule(sked), ein)
+        this_filing.set_result(self.whole_filing_data)
+        this_filing.set_keyerrors(self.filing_keyerr_data)
+        return this_filing
@@ -0,0 +1,169 @@
+"""
+Builds indexes on the return tables several at a time, each over its own
+connection with more maintenance_work_mem than a session gets by default.
+
+Which indexes make_indexes builds is set by profiles: each one names an
+index prefix, an index method and the columns to index.
+"""
+
+import queue
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection
+
+WORKERS = 4
+MAINTENANCE_WORK_MEM = "1GB"
+
+# profile: [(name prefix, method, columns)], the index is <prefix>_<table>
+INDEX_PROFILES = {
+    # what make_indexes has always built
+    "btree": [("xx", "btree", ["object_id", "ein"])],
+    # tiny; id follows load order, so this narrows scans of recent loads
+    "brin": [("xb", "brin", ["id"])],
+    # smaller and faster than a btree for looking up a single object_id
+    "hash": [("xh", "hash", ["object_id"])],
+}
+DEFAULT_PROFILES = ["btree"]
+# tables whose btree indexes get more columns, by table name prefix
+EXTRA_BTREE_COLUMNS = {"return_skdk": ['"documentId"']}
+
+CREATE_INDEX_RE = re.compile(r"^CREATE (UNIQUE )?INDEX ", re.IGNORECASE)
+
+EXISTING_INDEXES_QUERY = """
+select c.relname, i.indisvalid from pg_index i
+join pg_class c on c.oid = i.indexrelid
+where c.relnamespace = 'public'::regnamespace
+"""
+
+
+def get_index_prefixes():
+    return [spec[0] for specs in INDEX_PROFILES.values() for spec in specs]
+
+
+def get_profile_indexes(tables, profiles):
+    """(name, table, create statement) for each of the profiles' indexes"""
+    indexes = []
+    for table in tables:
+        for profile in profiles:
+            for prefix, method, columns in INDEX_PROFILES[profile]:
+                columns = list(columns)
+                if method == "btree":
+                    for table_prefix, extra in EXTRA_BTREE_COLUMNS.items():
+                        if table.startswith(table_prefix):
+                            columns += extra
+                name = "%s_%s" % (prefix, table)
+                if connection.vendor == "postgresql":
+                    statement = "create index %s on %s using %s (%s)" % (
+                        name,
+                        table,
+                        method,
+                        ", ".join(columns),
+                    )
+                else:
+                    statement = "create index %s on %s (%s)" % (
+                        name,
+                        table,
+                        ", ".join(columns),
+                    )
+                indexes.append((name, table, statement))
+    return indexes
+
+
+def get_existing_indexes(cursor):
+    """{index name: is valid}; a failed concurrent build leaves an invalid one"""
+    if connection.vendor != "postgresql":
+        return {
+            name: True
+            for table in connection.introspection.table_names(cursor)
+            for name in connection.introspection.get_constraints(cursor, table)
+        }
+    cursor.execute(EXISTING_INDEXES_QUERY)
+    return dict(cursor.fetchall())
+
+
+def make_concurrent(statement):
+    return CREATE_INDEX_RE.sub(
+        lambda match: "CREATE %sINDEX CONCURRENTLY " % (match.group(1) or ""),
+        statement,
+    )
+
+
+def build_worker(pending, maintenance_work_mem, concurrently, partitioned):
+    """
+    Build each table's indexes until the queue is empty. Runs in its own
+    thread.
+    """
+    built = 0
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute("set maintenance_work_mem = %s", [maintenance_work_mem])
+            while True:
+                try:
+                    table, table_indexes = pending.get_nowait()
+                except queue.Empty:
+                    break
+                for name, statement in table_indexes:
+                    # postgres can't build an index on a partitioned table concurrently
+                    if concurrently and table not in partitioned:
+                        statement = make_concurrent(statement)
+                    print("Running query: '%s' " % statement)
+                    start = time.time()
+                    cursor.execute(statement)
+                    print("%s: built in %.1fs" % (name, time.time() - start))
+                    built += 1
+    finally:
+        connection.close()
+    return built
+
+
+def build_indexes(
+    indexes,
+    workers=WORKERS,
+    maintenance_work_mem=MAINTENANCE_WORK_MEM,
+    concurrently=False,
+    partitioned=(),
+):
+    """
+    Build the (name, table, statement) indexes over at most `workers`
+    connections, skipping the ones that already exist. An invalid index
+    left by a failed concurrent build is dropped and built again. The
+    tables in partitioned are never built concurrently.
+
+    A table's indexes are built one after another, by the same worker;
+    concurrent builds on the same table can deadlock.
+    """
+    by_table = {}
+    with connection.cursor() as cursor:
+        existing = get_existing_indexes(cursor)
+        for name, table, statement in indexes:
+            if existing.get(name):
+                print("%s already exists, skipping" % name)
+                continue
+            if name in existing:
+                print("%s is invalid, building it again" % name)
+                cursor.execute("drop index %s" % name)
+            by_table.setdefault(table, []).append((name, statement))
+
+    pending = queue.Queue()
+    for table, table_indexes in by_table.items():
+        pending.put((table, table_indexes))
+
+    if connection.vendor != "postgresql":
+        # concurrent builds and parallel writers are postgres only
+        workers = 1
+        concurrently = False
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                build_worker, pending, maintenance_work_mem, concurrently, partitioned
+            )
+            for i in range(min(workers, len(by_table)))
+        ]
+        built = sum(future.result() for future in futures)
+    print("Built %s indexes in %.1fs" % (built, time.time() - start))
+    return built
@@ -1,63 +1,119 @@
-from django.apps import apps
+from irsdb.schemas.model_writers import get_writer
+from irsdb.schemas.row_adapters import get_registry
 
-# Setting too big will create memory problems
-BATCH_SIZE = 100
 VERBOSE = False
 
 # TODO: allow appname to be passed as an argument.
 APPNAME = "return"
 
-listtype = type([])
-
 
 class Accumulator(object):
-    def __init__(self):
+    def __init__(self, writer=None, flush_when_full=True, max_buffered_rows=None):
         self.model_dict = {}
-        self.model_cache = {}
+        self.registry = get_registry(APPNAME)
         # Expected:
-        # self.model_dict{model_name: [modeldictionary1, modeldictionary2,]...}
-
-    def _clean_restricted(self, dict):
-        """RESTRICTED is only sked b, SSN's appear in a variety of places
-        we could do a better job of restricting this
-        """
-        for key in dict.keys():
-            if type(dict[key]) == listtype:
-                print("\n\n***list found %s" % (key))
-
-            # IRS will replace anything they think is a SSN with "XXX-XX-XXXX"
-            # this seems to include 9 digit numbers.
-            # The result is that the irs can lengthen fields (breaking max_length)
-            # by doing this, so use a formulation that's shorter than this.
-            if dict[key]:
-                dict[key] = dict[key].replace("XXX-XX-XXXX", "-SSN-")
-
-                if dict[key] == "RESTRICTED":
-                    # These are numeric fields, don't try to save 'RESTRICTED'
-                    dict[key] = 0
-
-    def _get_model(self, model_name, appname="return"):
-        # cache locally so django doesn't try to hit the db every time
-        try:
-            return self.model_cache[appname + model_name]
-        except KeyError:
-            self.model_cache[model_name] = apps.get_model(appname, model_name)
-            return self.model_cache[model_name]
+        # self.model_dict{model_name: [row_tuple1, row_tuple2,]...}
+        # with the values in each tuple in the order of the model's columns
+        if writer is None:
+            writer = get_writer()
+        self.writer = writer
+        # When False, nothing is written until commit_all or write_rows
+        self.flush_when_full = flush_when_full
+        # Ceiling on rows held across all the buffers, None for no limit
+        self.max_buffered_rows = max_buffered_rows
+        self.buffered_rows = 0
+        # table: [SSN masks replaced, RESTRICTED values replaced]
+        self.redactions = {}
+
+    def _get_adapter(self, model_name):
+        return self.registry.get(model_name)
+
+    def _clean_rows(self, model_name, rows):
+        """Sanitize rows on their way out of the buffers"""
+        adapter = self._get_adapter(model_name)
+        rows, masked, restricted = adapter.clean(rows)
+        if masked or restricted:
+            counts = self.redactions.setdefault(adapter.table, [0, 0])
+            counts[0] += masked
+            counts[1] += restricted
+        return rows
+
+    def redaction_report(self):
+        for table, (masked, restricted) in sorted(self.redactions.items()):
+            print(
+                "\t%s: %s SSN masks, %s RESTRICTED values" % (table, masked, restricted)
+            )
 
     def commit_by_key(self, model_name):
         if self.model_dict[model_name]:
-            this_model = self._get_model(model_name)
             if VERBOSE:
                 print(
                     "Committing %s objects for key %s"
                     % (len(self.model_dict[model_name]), model_name)
                 )
-            this_model.objects.bulk_create(self.model_dict[model_name])
+            rows = self._clean_rows(model_name, self.model_dict[model_name])
+            self.write_rows({model_name: rows})
+            self.buffered_rows -= len(self.model_dict[model_name])
 
             # set array to empty
             self.model_dict[model_name] = []
 
-    def add_model(self, model_name, model_dict):
+    def write_rows(self, rows_by_model):
+        """Write cleaned rows, given as {model_name: [row_tuple1, ...]}"""
+        for model_name, rows in rows_by_model.items():
+            if rows:
+                self.writer.write(self._get_adapter(model_name), rows)
+
+    def take_rows(self):
+        """Empty the buffers and return their cleaned rows, without writing"""
+        rows_by_model = {
+            model_name: self._clean_rows(model_name, rows)
+            for model_name, rows in self.model_dict.items()
+        }
+        self.model_dict = {}
+        self.buffered_rows = 0
+        return rows_by_model
+
+    def split_by_filing(self, rows_by_model):
+        """Regroup rows as {object_id: {model_name: [row_tuple1, ...]}}"""
+        rows_by_filing = {}
+        for model_name, rows in rows_by_model.items():
+            adapter = self._get_adapter(model_name)
+            for row in rows:
+                filing_rows = rows_by_filing.setdefault(adapter.get_object_id(row), {})
+                filing_rows.setdefault(model_name, []).append(row)
+        return rows_by_filing
+
+    def discard(self, object_id):
+        """Drop any buffered rows from one filing"""
+        for model_name in self.model_dict.keys():
+            adapter = self._get_adapter(model_name)
+            self.model_dict[model_name] = [
+                row
+                for row in self.model_dict[model_name]
+                if adapter.get_object_id(row) != object_id
+            ]
+        self.buffered_rows = sum(len(rows) for rows in self.model_dict.values())
+
+    def is_full(self):
+        return (
+            self.max_buffered_rows is not None
+            and self.buffered_rows >= self.max_buffered_rows
+        )
+
+    def flush_largest(self):
+        """
+        Write the biggest buffers first until we're down to half the ceiling,
+        so one more row doesn't set off another flush straight away.
+        """
+        target = self.max_buffered_rows // 2
+        by_size = sorted(self.model_dict, key=self.count, reverse=True)
+        for model_name in by_size:
+            if self.buffered_rows <= target:
+                break
+            self.commit_by_key(model_name)
+
+    def add_model(self, model_name, model_dict, extra=None):
         # An artifact upstream is creating empty rows, with no name
         # and only an ein and object_id This is probably related to
         # the 'empty head' rows in variables.csv, which will be
@@ -68,17 +124,20 @@ class Accumulator(object):
                 % (model_dict["object_id"], model_dict)
             )
             return
-        this_model = self._get_model(model_name)
-        self._clean_restricted(model_dict)
-        model_instance = this_model(**model_dict)
+        row = self._get_adapter(model_name).adapt(model_dict, extra)
         try:
-            self.model_dict[model_name].append(model_instance)
+            self.model_dict[model_name].append(row)
 
         except KeyError:
-            self.model_dict[model_name] = [model_instance]
+            self.model_dict[model_name] = [row]
+        self.buffered_rows += 1
 
-        if len(self.model_dict[model_name]) >= BATCH_SIZE:
+        if not self.flush_when_full:
+            return
+        if len(self.model_dict[model_name]) >= self.writer.batch_size:
             self.commit_by_key(model_name)
+        elif self.is_full():
+            self.flush_largest()
 
     def commit_all(self):
         # commit everything
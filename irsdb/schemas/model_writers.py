@@ -0,0 +1,96 @@
+"""
+Writers take the rows buffered by the Accumulator and store them.
+
+Rows arrive as tuples in the column order of their RowAdapter, so a writer
+is free to skip building django model instances if the database gives it
+a faster path.
+"""
+
+import csv
+import io
+
+from django.db import connection
+
+# written in place of None; COPY is told to read it back as NULL
+COPY_NULL = "\\N"
+
+
+class BulkCreateWriter(object):
+    """Works on any database django supports."""
+
+    # Setting too big will create memory problems
+    batch_size = 100
+
+    def __init__(self, connection=connection):
+        self.connection = connection
+
+    def write(self, adapter, rows):
+        model = adapter.model
+        model.objects.using(self.connection.alias).bulk_create(
+            [model(**adapter.as_dict(row)) for row in rows]
+        )
+
+
+class CopyWriter(object):
+    """
+    Streams rows into postgres with COPY FROM STDIN in csv form.
+    No model instances are created.
+    """
+
+    batch_size = 1000
+
+    def __init__(self, connection=connection):
+        self.connection = connection
+        self.statements = {}
+
+    def get_statement(self, adapter):
+        # cache locally, this only depends on the table
+        try:
+            return self.statements[adapter.table]
+        except KeyError:
+            quote_name = self.connection.ops.quote_name
+            sql = "COPY %s (%s) FROM STDIN WITH (FORMAT csv, NULL '%s')" % (
+                quote_name(adapter.table),
+                ", ".join(quote_name(column) for column in adapter.columns),
+                COPY_NULL,
+            )
+            self.statements[adapter.table] = sql
+            return sql
+
+    def to_csv(self, rows):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        for row in rows:
+            writer.writerow([COPY_NULL if value is None else value for value in row])
+        buffer.seek(0)
+        return buffer
+
+    def write(self, adapter, rows):
+        sql = self.get_statement(adapter)
+        data = self.to_csv(rows)
+        # copy isn't part of django's cursor API, so its errors need wrapping
+        # as django.db exceptions by hand
+        with self.connection.cursor() as cursor, self.connection.wrap_database_errors:
+            if hasattr(cursor, "copy_expert"):
+                # psycopg2
+                cursor.copy_expert(sql, data)
+            else:
+                # psycopg 3
+                with cursor.copy(sql) as copy:
+                    copy.write(data.getvalue())
+
+
+WRITERS = {
+    "bulk_create": BulkCreateWriter,
+    "copy": CopyWriter,
+}
+
+
+def get_writer(name=None, connection=connection):
+    """Use COPY where we can, and fall back to bulk_create elsewhere."""
+    if name is None:
+        if connection.vendor == "postgresql":
+            name = "copy"
+        else:
+            name = "bulk_create"
+    return WRITERS[name](connection)
@@ -0,0 +1,159 @@
+"""
+Optional postgres partitioning of the return tables by submission_year.
+
+Each partitioned table gets a partition per year, <table>_<year>, plus a
+<table>_default partition for anything else. Removing a year is then a
+matter of detaching and dropping its partitions instead of deleting its
+rows one table at a time.
+
+Tables are partitioned by the PartitionByYear migration operation; see
+generate_schemas_from_metadata --partition.
+"""
+
+from django.db import connection
+from django.db.migrations.operations.base import Operation
+
+PARTITION_KEY = "submission_year"
+
+PARTITIONED_TABLES_QUERY = """
+    select c.relname from pg_partitioned_table p
+    join pg_class c on c.oid = p.partrelid
+    where c.relnamespace = 'public'::regnamespace
+"""
+
+
+def get_partition_name(table, year):
+    return "%s_%s" % (table, year)
+
+
+def get_default_partition_name(table):
+    return "%s_default" % table
+
+
+def get_return_tables(cursor):
+    """The return tables, leaving out the partitions of partitioned ones"""
+    # cursor.db is the connection the cursor belongs to, which migrations
+    # may run on instead of the default one
+    return [
+        table.name
+        for table in cursor.db.introspection.get_table_list(cursor)
+        if table.name.startswith("return") and table.type == "t"
+    ]
+
+
+def get_partitioned_tables(cursor):
+    if cursor.db.vendor != "postgresql":
+        return set()
+    cursor.execute(PARTITIONED_TABLES_QUERY)
+    return {row[0] for row in cursor.fetchall() if row[0].startswith("return")}
+
+
+def create_partition(cursor, table, year):
+    cursor.execute(
+        "create table if not exists %s partition of %s for values in (%s)"
+        % (get_partition_name(table, year), table, int(year))
+    )
+
+
+def create_year_partitions(year):
+    """Make sure every partitioned return table has a partition for year"""
+    with connection.cursor() as cursor:
+        tables = get_partitioned_tables(cursor)
+        for table in sorted(tables):
+            create_partition(cursor, table, year)
+    return tables
+
+
+def drop_year_partitions(year):
+    """
+    Detach and drop the year's partition from every partitioned return
+    table. Returns the tables that had one.
+    """
+    dropped = []
+    with connection.cursor() as cursor:
+        for table in sorted(get_partitioned_tables(cursor)):
+            partition = get_partition_name(table, year)
+            cursor.execute("select to_regclass(%s)", [partition])
+            if cursor.fetchone()[0] is None:
+                continue
+            cursor.execute("alter table %s detach partition %s" % (table, partition))
+            cursor.execute("drop table %s" % partition)
+            dropped.append(table)
+    return dropped
+
+
+class PartitionByYear(Operation):
+    """
+    Rebuild a model's table as a table partitioned by submission_year,
+    keeping any rows already in it. Rows without a submission_year get
+    their filing's, or 0 if the filing is gone, which lands them in the
+    default partition. Does nothing on databases other than postgres.
+    """
+
+    reversible = False
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+
+    def state_forwards(self, app_label, state):
+        # the model is unchanged, only its table is
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        model = to_state.apps.get_model(app_label, self.model_name)
+        table = model._meta.db_table
+        old_table = "%s_unpartitioned" % table
+
+        with schema_editor.connection.cursor() as cursor:
+            if table in get_partitioned_tables(cursor):
+                return
+            cursor.execute("alter table %s rename to %s" % (table, old_table))
+            # free the primary key's and sequence's names for the new table
+            cursor.execute(
+                "alter index if exists %s_pkey rename to %s_pkey" % (table, old_table)
+            )
+            cursor.execute(
+                "alter sequence if exists %s_id_seq rename to %s_id_seq"
+                % (table, old_table)
+            )
+            cursor.execute(
+                "update %s t set %s = f.submission_year from filing_filing f "
+                "where t.object_id = f.object_id and t.%s is null"
+                % (old_table, PARTITION_KEY, PARTITION_KEY)
+            )
+            cursor.execute(
+                "update %s set %s = 0 where %s is null"
+                % (old_table, PARTITION_KEY, PARTITION_KEY)
+            )
+            cursor.execute(
+                "create table %s (like %s including defaults including identity) "
+                "partition by list (%s)" % (table, old_table, PARTITION_KEY)
+            )
+            # a partitioned table's primary key has to include its key
+            cursor.execute(
+                "alter table %s add primary key (id, %s)" % (table, PARTITION_KEY)
+            )
+            cursor.execute(
+                "create table %s partition of %s default"
+                % (get_default_partition_name(table), table)
+            )
+
+            cursor.execute(
+                "select distinct %s from %s where %s <> 0"
+                % (PARTITION_KEY, old_table, PARTITION_KEY)
+            )
+            for (year,) in cursor.fetchall():
+                create_partition(cursor, table, year)
+
+            cursor.execute("insert into %s select * from %s" % (table, old_table))
+            cursor.execute(
+                "select setval(pg_get_serial_sequence(%s, 'id'), "
+                "coalesce(max(id), 0) + 1, false) from " + table,
+                [table],
+            )
+            cursor.execute("drop table %s" % old_table)
+
+    def describe(self):
+        return "Partition %s by %s" % (self.model_name, PARTITION_KEY)
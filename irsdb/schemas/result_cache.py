@@ -0,0 +1,100 @@
+"""
+An on-disk cache of what irsx makes of each filing, so loading a year
+again doesn't mean parsing all of its xml again.
+
+Entries are pickled (result, keyerrors, version) tuples, stored under a
+directory for the installed irsx version so a new irsx starts a fresh
+cache. The least recently used entries are removed once the cache grows
+past its size limit.
+"""
+
+import os
+import pickle
+from importlib.metadata import PackageNotFoundError, version
+
+try:
+    IRSX_VERSION = version("irsx")
+except PackageNotFoundError:
+    IRSX_VERSION = "unknown"
+
+# After this share of the limit has been written, check the cache's size
+CHECK_FRACTION = 0.1
+# Evict down to this share of the limit, so we aren't evicting constantly
+EVICT_TO_FRACTION = 0.9
+
+
+class ResultCache(object):
+    def __init__(self, directory, max_bytes):
+        self.directory = os.path.join(directory, "irsx-%s" % IRSX_VERSION)
+        self.max_bytes = max_bytes
+        self.written_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_path(self, object_id):
+        # spread entries over a thousand directories
+        return os.path.join(self.directory, object_id[-3:], "%s.pickle" % object_id)
+
+    def has(self, object_id):
+        return os.path.exists(self.get_path(object_id))
+
+    def get(self, object_id):
+        """Returns (result, keyerrors, version), or None if it isn't cached"""
+        path = self.get_path(object_id)
+        try:
+            with open(path, "rb") as infile:
+                entry = pickle.load(infile)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return None
+        # mark it used, for eviction; atime isn't reliable
+        os.utime(path)
+        self.hits += 1
+        return entry
+
+    def put(self, object_id, result, keyerrors, schema_version):
+        path = self.get_path(object_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = pickle.dumps((result, keyerrors, schema_version), protocol=5)
+        # several loaders may share a cache, so never leave half an entry
+        partial_path = "%s.%s.part" % (path, os.getpid())
+        with open(partial_path, "wb") as outfile:
+            outfile.write(data)
+        os.replace(partial_path, path)
+
+        self.written_bytes += len(data)
+        if self.written_bytes >= self.max_bytes * CHECK_FRACTION:
+            self.evict()
+            self.written_bytes = 0
+
+    def evict(self):
+        """Remove the least recently used entries if the cache is too big"""
+        entries = []
+        total = 0
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * EVICT_TO_FRACTION
+        removed = 0
+        for mtime, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # another loader got to it first
+                pass
+            total -= size
+            removed += 1
+        print("Evicted %s entries from the result cache" % removed)
@@ -0,0 +1,194 @@
+"""
+Row adapters turn the dicts irsx returns into tuples in a return table's
+column order. Before they're written, a batch of tuples is sanitized and
+coerced one column at a time. Writers take the tuples as they are, so no
+django model instances are built on the way to the database.
+"""
+
+from decimal import Decimal, InvalidOperation
+
+from django.apps import apps
+
+INTEGER_FIELDS = [
+    "IntegerField",
+    "BigIntegerField",
+    "SmallIntegerField",
+    "PositiveIntegerField",
+    "PositiveBigIntegerField",
+    "PositiveSmallIntegerField",
+]
+TEXT_FIELDS = ["CharField", "TextField"]
+
+# IRS will replace anything they think is a SSN with "XXX-XX-XXXX"
+# this seems to include 9 digit numbers.
+# The result is that the irs can lengthen fields (breaking max_length)
+# by doing this, so use a formulation that's shorter than this.
+SSN_MASK = "XXX-XX-XXXX"
+SSN_REPLACEMENT = "-SSN-"
+# RESTRICTED is only sked b, and only in numeric fields
+RESTRICTED = "RESTRICTED"
+
+
+def to_int(value):
+    # leave anything that isn't a number for the database to reject
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def to_decimal(value):
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        return value
+
+
+def get_coercer(field):
+    """Returns a function to convert values for a numeric field, or None"""
+    internal_type = field.get_internal_type()
+    if internal_type in INTEGER_FIELDS:
+        return to_int
+    if internal_type == "DecimalField":
+        return to_decimal
+    return None
+
+
+class RowAdapter(object):
+    """Precomputed column order and coercion for one return model."""
+
+    def __init__(self, model):
+        self.model = model
+        self.table = model._meta.db_table
+        self.fields = [
+            field for field in model._meta.concrete_fields if not field.primary_key
+        ]
+        self.attnames = [field.attname for field in self.fields]
+        self.columns = [field.column for field in self.fields]
+        self.positions = {attname: index for index, attname in enumerate(self.attnames)}
+        self.object_id_index = self.positions["object_id"]
+
+        # (position, max_length) for the columns that get SSN masks replaced
+        self.text_columns = []
+        # (position, coercer) for the columns where RESTRICTED becomes 0
+        self.numeric_columns = []
+        for index, field in enumerate(self.fields):
+            coerce = get_coercer(field)
+            if coerce:
+                self.numeric_columns.append((index, coerce))
+            elif field.get_internal_type() in TEXT_FIELDS:
+                self.text_columns.append((index, field.max_length))
+
+    def adapt(self, row, extra=None):
+        """
+        Put a row's values in column order; they're cleaned later. Values
+        in extra, like the filing's submission_year, are only kept if the
+        table has a column for them.
+        """
+        values = [None] * len(self.fields)
+        for key, value in row.items():
+            try:
+                values[self.positions[key]] = value
+            except KeyError:
+                raise TypeError(
+                    "%s has no column named '%s'" % (self.model.__name__, key)
+                )
+        if extra:
+            for key, value in extra.items():
+                index = self.positions.get(key)
+                if index is not None:
+                    values[index] = value
+        return tuple(values)
+
+    def clean_text(self, values, max_length):
+        masked = 0
+        cleaned = []
+        for value in values:
+            if value:
+                if SSN_MASK in value:
+                    masked += 1
+                    value = value.replace(SSN_MASK, SSN_REPLACEMENT)
+                if max_length and len(value) > max_length:
+                    value = value[:max_length]
+            cleaned.append(value)
+        return cleaned, masked
+
+    def clean_numeric(self, values, coerce):
+        restricted = 0
+        cleaned = []
+        for value in values:
+            if value is not None:
+                if value == RESTRICTED:
+                    restricted += 1
+                    value = 0
+                else:
+                    value = coerce(value)
+            cleaned.append(value)
+        return cleaned, restricted
+
+    def clean(self, rows):
+        """
+        Sanitize and convert a batch of rows, one column at a time. Returns
+        the cleaned rows, and how many SSN masks and RESTRICTED values
+        were replaced.
+        """
+        if not rows:
+            return rows, 0, 0
+        columns = list(zip(*rows))
+        masked = restricted = 0
+        for index, max_length in self.text_columns:
+            # most columns are empty in most rows, skip the ones that are
+            # empty in all of them
+            if any(columns[index]):
+                columns[index], count = self.clean_text(columns[index], max_length)
+                masked += count
+        for index, coerce in self.numeric_columns:
+            if any(value is not None for value in columns[index]):
+                columns[index], count = self.clean_numeric(columns[index], coerce)
+                restricted += count
+        return list(zip(*columns)), masked, restricted
+
+    def get_object_id(self, row):
+        return row[self.object_id_index]
+
+    def as_dict(self, row):
+        return dict(zip(self.attnames, row))
+
+
+class ModelRegistry(object):
+    """
+    Row adapters for every model in an app, keyed by the part and group
+    names irsx uses. Build it once per process with get_registry.
+    """
+
+    def __init__(self, appname="return"):
+        self.appname = appname
+        self.adapters = {}
+        for model in apps.get_app_config(appname).get_models():
+            self.adapters[model._meta.model_name] = RowAdapter(model)
+
+    def get(self, name):
+        try:
+            return self.adapters[name]
+        except KeyError:
+            # model names are stored lower case; remember the name irsx used
+            # so the next lookup hits straight away
+            try:
+                adapter = self.adapters[name.lower()]
+            except KeyError:
+                raise LookupError(
+                    "App '%s' doesn't have a '%s' model." % (self.appname, name)
+                )
+            self.adapters[name] = adapter
+            return adapter
+
+
+registries = {}
+
+
+def get_registry(appname="return"):
+    try:
+        return registries[appname]
+    except KeyError:
+        registries[appname] = ModelRegistry(appname)
+        return registries[appname]
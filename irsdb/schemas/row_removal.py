@@ -0,0 +1,297 @@
+"""
+Removes filings' rows from the return tables, for remove_year and
+remove_half_loaded.
+
+The filings to remove are picked out by a condition on filing_filing.
+Each connection copies their ids into a temp table once, then deletes
+from one return table after another by joining filing_id against it.
+Rows loaded before return rows had a filing_id are joined on object_id
+instead. Several connections work through the tables at the same time.
+
+When most of a table is going, it's cheaper to copy the rows that stay
+into a new table and swap it in than to delete the rest row by row and
+vacuum afterwards. remove_rows does that for the tables it's told to
+rewrite; estimate_removed_fractions helps pick them. Tables that views
+depend on can't be swapped out, so they're deleted from instead.
+"""
+
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection, transaction
+
+CONNECTIONS = 4
+# rewrite a table instead once more than this share of it is being removed
+REWRITE_FRACTION = 0.3
+TARGET_TABLE = "removal_targets"
+
+CREATE_TARGETS = (
+    "create temporary table %s (id integer primary key, object_id varchar(31))"
+    % TARGET_TABLE
+)
+FILL_TARGETS = (
+    "insert into %s select id, object_id from filing_filing where {condition}"
+    % TARGET_TABLE
+)
+# separate deletes, as an IN under an OR can't be planned as a join; the
+# second only has to look at rows loaded before filing_id was stored
+DELETES_USING = [
+    "delete from %s t using " + TARGET_TABLE + " r where t.filing_id = r.id",
+    "delete from %s t using " + TARGET_TABLE + " r "
+    "where t.filing_id is null and t.object_id = r.object_id",
+]
+DELETES_IN = [
+    "delete from %s where filing_id in (select id from " + TARGET_TABLE + ")",
+    "delete from %s where filing_id is null "
+    "and object_id in (select object_id from " + TARGET_TABLE + ")",
+]
+
+# puts the filings back the way enter_yearly_submissions left them
+FILING_RESET = """
+update filing_filing set
+    parse_started=False,
+    parse_complete=False,
+    parse_worker=Null,
+    process_time=Null,
+    is_error=False,
+    key_error_count=Null,
+    error_details=Null
+where {condition}
+"""
+
+KEEP_ROWS = (
+    "insert into %s select * from %s t where not exists "
+    "(select 1 from " + TARGET_TABLE + " r where r.id = t.filing_id) "
+    "and not exists (select 1 from " + TARGET_TABLE + " r "
+    "where t.filing_id is null and r.object_id = t.object_id)"
+)
+
+# the constraints that carry indexes, or that LIKE doesn't copy
+CONSTRAINTS_QUERY = """
+select conname, pg_get_constraintdef(oid) from pg_constraint
+where conrelid = %s::regclass and contype in ('p', 'u', 'f', 'x')
+order by contype
+"""
+INDEXES_QUERY = """
+select indexdef from pg_indexes i
+where tablename = %s and schemaname = 'public'
+and not exists (select 1 from pg_constraint c where c.conname = i.indexname)
+"""
+
+# views whose rules read the table; dropping the table would take them with it
+DEPENDENT_VIEWS_QUERY = """
+select distinct v.oid::regclass::text from pg_depend d
+join pg_rewrite r on r.oid = d.objid
+join pg_class v on v.oid = r.ev_class
+where d.classid = 'pg_rewrite'::regclass and d.refobjid = %s::regclass
+and v.oid <> d.refobjid
+"""
+# the table's grants, which LIKE doesn't copy
+GRANTS_QUERY = """
+select g.privilege_type,
+    case when g.grantee = 0 then 'public' else quote_ident(r.rolname) end,
+    g.is_grantable
+from pg_class c cross join aclexplode(c.relacl) g
+left join pg_roles r on r.oid = g.grantee
+where c.oid = %s::regclass
+"""
+
+# how common the year is in each return table's submission_year, from ANALYZE
+YEAR_STATS_QUERY = """
+select tablename, most_common_vals::text, most_common_freqs from pg_stats
+where schemaname = 'public' and attname = 'submission_year'
+and tablename like 'return%'
+"""
+
+TABLE_SIZES_QUERY = """
+select relname, reltuples from pg_class
+where relkind in ('r', 'p') and relnamespace = 'public'::regnamespace
+"""
+
+
+def get_table_sizes(cursor):
+    """Postgres' estimate of each table's row count, by name"""
+    if connection.vendor != "postgresql":
+        return {}
+    cursor.execute(TABLE_SIZES_QUERY)
+    return dict(cursor.fetchall())
+
+
+def estimate_removed_fractions(cursor, year, filing_share):
+    """
+    Estimate the share of each return table that removing year takes out.
+    Uses the statistics on submission_year where the table has been
+    analyzed since that column was filled, and filing_share, the year's
+    share of the loaded filings, where it hasn't.
+    """
+    fractions = {}
+    cursor.execute(YEAR_STATS_QUERY)
+    for table, values, freqs in cursor.fetchall():
+        if values is None:
+            continue
+        years = [int(value) for value in values.strip("{}").split(",")]
+        fractions[table] = freqs[years.index(year)] if year in years else 0.0
+
+    sizes = get_table_sizes(cursor)
+    return {
+        table: fractions.get(table, filing_share)
+        for table, size in sizes.items()
+        # never analyzed or empty; there's nothing to gain
+        if table.startswith("return") and size > 0
+    }
+
+
+def get_dependent_views(cursor, table):
+    if connection.vendor != "postgresql":
+        return []
+    cursor.execute(DEPENDENT_VIEWS_QUERY, [table])
+    return [row[0] for row in cursor.fetchall()]
+
+
+def rewrite_table(cursor, table):
+    """
+    Replace table with a copy holding only the rows that aren't being
+    removed, rebuilding its indexes and constraints on the copy and
+    carrying over its grants and comment. The swap happens in one
+    transaction, so readers see the old table or the new one. Returns the
+    number of rows removed.
+    """
+    new_table = "%s_rewrite" % table
+    with transaction.atomic():
+        cursor.execute("lock table %s in access exclusive mode" % table)
+        cursor.execute(CONSTRAINTS_QUERY, [table])
+        constraints = cursor.fetchall()
+        cursor.execute(INDEXES_QUERY, [table])
+        indexes = [row[0] for row in cursor.fetchall()]
+        cursor.execute(GRANTS_QUERY, [table])
+        grants = cursor.fetchall()
+        cursor.execute("select obj_description(%s::regclass, 'pg_class')", [table])
+        comment = cursor.fetchone()[0]
+        cursor.execute("select count(*) from %s" % table)
+        before = cursor.fetchone()[0]
+
+        # no indexes yet, they're faster to build once the rows are in
+        cursor.execute(
+            "create table %s (like %s including all excluding indexes)"
+            % (new_table, table)
+        )
+        cursor.execute(KEEP_ROWS % (new_table, table))
+        kept = cursor.rowcount
+        # carry on numbering where the old table left off
+        cursor.execute(
+            "select setval(pg_get_serial_sequence(%s, 'id'), "
+            "coalesce(max(id), 0) + 1, false) from " + table,
+            [new_table],
+        )
+
+        cursor.execute("drop table %s" % table)
+        cursor.execute("alter table %s rename to %s" % (new_table, table))
+        cursor.execute(
+            "alter sequence %s_id_seq rename to %s_id_seq" % (new_table, table)
+        )
+        for name, definition in constraints:
+            cursor.execute(
+                'alter table %s add constraint "%s" %s' % (table, name, definition)
+            )
+        for definition in indexes:
+            cursor.execute(definition)
+        for privilege, grantee, grantable in grants:
+            cursor.execute(
+                "grant %s on %s to %s%s"
+                % (privilege, table, grantee, " with grant option" if grantable else "")
+            )
+        if comment is not None:
+            cursor.execute("comment on table %s is %%s" % table, [comment])
+    cursor.execute("analyze %s" % table)
+    return before - kept
+
+
+def remove_worker(tables, condition, params):
+    """
+    Delete from tables until the queue is empty, or rewrite them if
+    they're flagged for it. Runs in its own thread.
+    """
+    removed = 0
+    deletes = DELETES_USING if connection.vendor == "postgresql" else DELETES_IN
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(CREATE_TARGETS)
+            cursor.execute(FILL_TARGETS.format(condition=condition), params)
+            cursor.execute("analyze %s" % TARGET_TABLE)
+
+            while True:
+                try:
+                    table, rewrite = tables.get_nowait()
+                except queue.Empty:
+                    break
+                start = time.time()
+                if rewrite:
+                    views = get_dependent_views(cursor, table)
+                    if views:
+                        print(
+                            "%s: deleting instead of rewriting, views depend on it: %s"
+                            % (table, ", ".join(views))
+                        )
+                        rewrite = False
+                if rewrite:
+                    table_removed = rewrite_table(cursor, table)
+                else:
+                    table_removed = 0
+                    for delete in deletes:
+                        cursor.execute(delete % table)
+                        table_removed += cursor.rowcount
+                print(
+                    "%s: %s %s rows in %.1fs"
+                    % (
+                        table,
+                        "rewrote, removing" if rewrite else "removed",
+                        table_removed,
+                        time.time() - start,
+                    )
+                )
+                removed += table_removed
+    finally:
+        # each thread has its own connection, which takes the temp table with it
+        connection.close()
+    return removed
+
+
+def remove_rows(tables, condition, params, workers=CONNECTIONS, rewrite=()):
+    """
+    Delete the rows of the filings matching condition from each table,
+    over at most `workers` connections. The tables in rewrite are copied
+    without them instead, on postgres only. Returns the number of rows
+    removed.
+    """
+    with connection.cursor() as cursor:
+        sizes = get_table_sizes(cursor)
+    if connection.vendor == "sqlite":
+        # sqlite only lets one connection write at a time
+        workers = 1
+
+    # start on the biggest tables, so one isn't left running on its own
+    pending = queue.Queue()
+    for table in sorted(tables, key=lambda t: sizes.get(t, 0), reverse=True):
+        pending.put((table, table in rewrite))
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(remove_worker, pending, condition, params)
+            for i in range(min(workers, len(tables)))
+        ]
+        removed = sum(future.result() for future in futures)
+    print(
+        "Removed %s rows from %s tables in %.1fs"
+        % (removed, len(tables), time.time() - start)
+    )
+    return removed
+
+
+def reset_filings(condition, params):
+    """Mark the filings matching condition as not loaded, in one update"""
+    with connection.cursor() as cursor:
+        cursor.execute(FILING_RESET.format(condition=condition), params)
+        print("Reset %s filings" % cursor.rowcount)
+        return cursor.rowcount
@@ -0,0 +1,84 @@
+"""
+Downloads the xml for claimed filings that aren't on disk yet, so the
+parser finds them in place instead of fetching them one at a time.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from irsdb.filing.xml_store import filing_exists
+
+CONNECTIONS = 8
+# seconds to wait on a connection or a read
+TIMEOUT = 60
+CHUNK_SIZE = 64 * 1024
+
+
+class XMLPrefetcher(object):
+    """
+    Each call to prefetch starts downloading a batch's missing files in a
+    pool of threads, at most `connections` at a time over a shared pool of
+    connections, and returns their futures. wait blocks until they're all
+    in place.
+
+    Files are fetched from Filing.get_aws_URL, so set XML_BASE_URL to
+    point it at a mirror or a local stand-in.
+    """
+
+    def __init__(self, connections=CONNECTIONS, timeout=TIMEOUT):
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=connections, pool_block=True
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=connections)
+        self.downloaded = 0
+        self.failed = 0
+
+    def download(self, filing):
+        """Fetch one filing to its local path. Returns True if it worked"""
+        url = filing.get_aws_URL()
+        filepath = filing.get_local_URL()
+        partial_path = "%s.part" % filepath
+        try:
+            with self.session.get(url, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                with open(partial_path, "wb") as outfile:
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        outfile.write(chunk)
+        except (requests.RequestException, OSError) as e:
+            print("Couldn't prefetch %s: %s" % (filing.object_id, e))
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            return False
+        # the parser never sees a half written file
+        os.replace(partial_path, filepath)
+        return True
+
+    def prefetch(self, filings):
+        """Start downloading the missing files, returns the futures to wait on"""
+        return [
+            self.executor.submit(self.download, filing)
+            for filing in filings
+            if not filing_exists(filing.object_id, filing.submission_year)
+        ]
+
+    def wait(self, downloads):
+        """Wait for the downloads prefetch started, returns how many worked"""
+        downloaded = 0
+        for future in as_completed(downloads):
+            if future.result():
+                downloaded += 1
+            else:
+                self.failed += 1
+        self.downloaded += downloaded
+        return downloaded
+
+    def close(self):
+        self.executor.shutdown()
+        self.session.close()
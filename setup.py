@@ -2,7 +2,7 @@
 from setuptools import find_packages, setup
 
 install_requires = [
-    "Django>=2.0.1",
+    "Django>=4.1",
     "requests",
     "unidecode",
     "irsx @  https://github.com/datamade/990-xml-reader/releases/download/0.10/irsx-0.3.2-py3-none-any.whl",
@@ -18,6 +18,7 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=install_requires,
+    extras_require={"zstd": ["zstandard"]},
     platforms=["any"],
     classifiers=[
         "Development Status :: 5 - Production/Stable",